@@ -5,26 +5,334 @@ Comprehensive backup of GitHub accounts including repositories, metadata, and se
 """
 
 import os
-import json
+import heapq
 import shutil
+import subprocess
+import threading
+import time
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 import logging
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import nullcontext
 
 import click
+import orjson
+import zstandard
 from github import Github, GithubException
-from git import Repo, GitCommandError
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
 from rich.table import Table
 from rich.panel import Panel
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from settings import SettingsManager
 
 console = Console()
 
+GRAPHQL_URL = "https://api.github.com/graphql"
+
+# Fast zstd level for compressed metadata; JSON still shrinks 5-10x
+ZSTD_LEVEL = 3
+
+# Connections kept alive for the concurrent clone and metadata workers
+HTTP_POOL_SIZE = 32
+
+# Seconds between checks of a repository backup's cancel event while waiting for results
+CANCEL_POLL_INTERVAL = 0.2
+
+# File inside a mirror holding the pushed_at of the last successful sync with GitHub
+SYNCED_PUSHED_AT_FILE = 'gitkeeper-synced-pushed-at'
+
+# Suffix of the file next to a metadata file holding the ETag it was written for
+ETAG_SUFFIX = '.etag'
+
+# Size and repository count of a finished backup, so listings don't walk its tree
+BACKUP_STATS_FILE = '.summary.json'
+
+# REST endpoints probed with If-None-Match to detect unchanged metadata files.
+# Issues are probed by their most recently updated entry (covers PRs and comments);
+# releases need the whole list on a single page for the ETag to cover every release.
+# Known limitation: deleting an issue or renaming a label doesn't change the most
+# recently updated issue, so a reused issues.json keeps the old state until another
+# issue is updated.
+CONDITIONAL_ENDPOINTS = {
+    'issues.json': ("https://api.github.com/repos/{full_name}/issues?state=all&sort=updated&direction=desc&per_page=1", False),
+    'releases.json': ("https://api.github.com/repos/{full_name}/releases?per_page=100", True),
+}
+
+# Issues, pull requests and releases of a repository, one page per request.
+# Each part can be left out of the query via its @include variable.
+REPOSITORY_METADATA_QUERY = """
+query(
+  $owner: String!, $name: String!,
+  $issuesCursor: String, $pullRequestsCursor: String, $releasesCursor: String,
+  $withIssues: Boolean!, $withPullRequests: Boolean!, $withReleases: Boolean!
+) {
+  repository(owner: $owner, name: $name) {
+    issues(first: 100, after: $issuesCursor, orderBy: {field: CREATED_AT, direction: DESC}) @include(if: $withIssues) {
+      pageInfo { hasNextPage endCursor }
+      nodes { ...IssueFields }
+    }
+    pullRequests(first: 100, after: $pullRequestsCursor, orderBy: {field: CREATED_AT, direction: DESC}) @include(if: $withPullRequests) {
+      pageInfo { hasNextPage endCursor }
+      nodes { ...PullRequestFields }
+    }
+    releases(first: 100, after: $releasesCursor) @include(if: $withReleases) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        id tagName name description isDraft isPrerelease createdAt publishedAt
+        releaseAssets(first: 100) {
+          pageInfo { hasNextPage endCursor }
+          nodes { name downloadUrl size }
+        }
+      }
+    }
+  }
+}
+
+fragment IssueFields on Issue {
+  id number title body state createdAt updatedAt closedAt
+  author { login }
+  labels(first: 100) { nodes { name } }
+  comments(first: 100) {
+    pageInfo { hasNextPage endCursor }
+    nodes { author { login } body createdAt }
+  }
+}
+
+fragment PullRequestFields on PullRequest {
+  id number title body state createdAt updatedAt closedAt
+  author { login }
+  labels(first: 100) { nodes { name } }
+  comments(first: 100) {
+    pageInfo { hasNextPage endCursor }
+    nodes { author { login } body createdAt }
+  }
+}
+"""
+
+# user_profile.json keys and the /user API fields they are read from
+USER_PROFILE_FIELDS = (
+    ('login', 'login'),
+    ('name', 'name'),
+    ('email', 'email'),
+    ('bio', 'bio'),
+    ('blog', 'blog'),
+    ('location', 'location'),
+    ('company', 'company'),
+    ('avatar_url', 'avatar_url'),
+    ('created_at', 'created_at'),
+    ('updated_at', 'updated_at'),
+    ('public_repos', 'public_repos'),
+    ('private_repos', 'total_private_repos'),
+    ('followers', 'followers'),
+    ('following', 'following'),
+)
+
+# GraphQL cursor and @include variables of each paginated repository connection
+CONNECTION_VARIABLES = {
+    'issues': ('issuesCursor', 'withIssues'),
+    'pullRequests': ('pullRequestsCursor', 'withPullRequests'),
+    'releases': ('releasesCursor', 'withReleases'),
+}
+
+# Further pages of a nested connection (comments or release assets) of a single node
+NODE_CONNECTION_QUERY = """
+query($id: ID!, $cursor: String) {
+  node(id: $id) {
+    ... on Issue {
+      comments(first: 100, after: $cursor) {
+        pageInfo { hasNextPage endCursor }
+        nodes { author { login } body createdAt }
+      }
+    }
+    ... on PullRequest {
+      comments(first: 100, after: $cursor) {
+        pageInfo { hasNextPage endCursor }
+        nodes { author { login } body createdAt }
+      }
+    }
+    ... on Release {
+      releaseAssets(first: 100, after: $cursor) {
+        pageInfo { hasNextPage endCursor }
+        nodes { name downloadUrl size }
+      }
+    }
+  }
+}
+"""
+
+
+class GraphQLError(Exception):
+    """Raised when the GitHub GraphQL API returns errors."""
+
+
+class RateLimiter:
+    """Throttle API requests once the remaining rate-limit quota runs low.
+    
+    State is fed from the X-RateLimit-* headers of responses, tracked per
+    resource (core REST, GraphQL). Below the threshold, requests are spread
+    evenly over the time left until the limit resets.
+    """
+    
+    def __init__(self, threshold: int = 100, pause: float = 0.5):
+        self.threshold = threshold
+        self.pause = pause
+        self._lock = threading.Lock()
+        self._limits: Dict[str, Tuple[int, float]] = {}
+        
+    def update(self, resource: str, remaining: int, reset_time: float):
+        """Record the remaining quota and reset time for a resource."""
+        with self._lock:
+            self._limits[resource] = (remaining, reset_time)
+            
+    def update_from_headers(self, headers):
+        """Record rate-limit state from GitHub response headers."""
+        if 'X-RateLimit-Remaining' not in headers:
+            return
+        self.update(
+            headers.get('X-RateLimit-Resource', 'core'),
+            int(headers['X-RateLimit-Remaining']),
+            float(headers.get('X-RateLimit-Reset', 0))
+        )
+        
+    def acquire(self, resource: str = 'core'):
+        """Block as long as needed before making a request against a resource."""
+        with self._lock:
+            limit = self._limits.get(resource)
+            
+        if limit is None:
+            return
+            
+        remaining, reset_time = limit
+        if remaining >= self.threshold:
+            return
+            
+        # Spread the remaining requests over the rest of the window
+        delay = max(0.0, reset_time - time.time()) / max(remaining, 1)
+        time.sleep(max(delay, self.pause))
+
+
+def create_missing_dirs(parent: Path, names: Iterable[str]) -> None:
+    """Create the named subdirectories of parent, listing it once instead of probing each one."""
+    with os.scandir(parent) as entries:
+        existing = {entry.name for entry in entries if entry.is_dir()}
+        
+    for name in names:
+        if name not in existing:
+            os.mkdir(parent / name)
+            existing.add(name)
+
+
+def write_json(path: Path, data) -> None:
+    """Write data as indented JSON, encoded with orjson in a single write."""
+    with open(path, 'wb') as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+
+
+def write_json_stream(path: Path, items: Iterable, compress: bool = False) -> int:
+    """Write items as an indented JSON array, serializing one element at a time.
+    
+    The output is identical to write_json() on the equivalent list, without
+    ever holding the whole list in memory. With compress, it is zstd-compressed
+    as it is written. Returns the number of items written.
+    """
+    count = 0
+    # Compressors aren't thread-safe, so each file gets its own
+    with open(path, 'wb') as raw, \
+            (zstandard.ZstdCompressor(level=ZSTD_LEVEL).stream_writer(raw) if compress else nullcontext(raw)) as f:
+        f.write(b'[')
+        for item in items:
+            f.write(b',\n  ' if count else b'\n  ')
+            # Raw newlines only occur between tokens, so this nests the element's indentation
+            f.write(orjson.dumps(item, option=orjson.OPT_INDENT_2).replace(b'\n', b'\n  '))
+            count += 1
+        f.write(b'\n]' if count else b']')
+    return count
+
+
+def dir_size(path) -> int:
+    """Return the total size in bytes of the files under path, without following symlinks."""
+    total = 0
+    stack = [path]
+    while stack:
+        # DirEntry caches the file type from readdir, so each file costs a single stat
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    total += entry.stat(follow_symlinks=False).st_size
+    return total
+
+
+def _compute_backup_stats(backup_root: Path) -> Dict:
+    """Compute a backup's size and repository count."""
+    # Count entries straight off the directory stream, without building a list of names
+    try:
+        with os.scandir(backup_root / 'repositories') as entries:
+            repo_count = sum(1 for _ in entries)
+    except FileNotFoundError:
+        repo_count = 0
+        
+    return {
+        'size_bytes': dir_size(backup_root),
+        'repo_count': repo_count,
+        'created_ts': backup_root.stat().st_mtime,
+    }
+
+
+def write_backup_stats(backup_root: Path) -> Dict:
+    """Compute a finished backup's size and repository count and store them in its stats file."""
+    root_stat = backup_root.stat()
+    stats = _compute_backup_stats(backup_root)
+    
+    # Write then rename, so a reader never sees a half-written file
+    stats_file = backup_root / BACKUP_STATS_FILE
+    tmp_file = stats_file.with_name(stats_file.name + '.tmp')
+    write_json(tmp_file, stats)
+    os.replace(tmp_file, stats_file)
+    # Backups are ordered by modification time, which adding the file must not change
+    os.utime(backup_root, ns=(root_stat.st_atime_ns, root_stat.st_mtime_ns))
+    return stats
+
+
+def refresh_backup_stats(backup_root: Path) -> None:
+    """Recompute a backup's stored stats after it was changed in place.
+    
+    Backups without a stats file are still running or were cancelled; their stats are
+    computed on every read instead, so there is nothing to refresh.
+    """
+    if (backup_root / BACKUP_STATS_FILE).exists():
+        write_backup_stats(backup_root)
+
+
+def read_backup_stats(backup_root: Path) -> Dict:
+    """Return a backup's stored stats, computing them for backups that have none.
+    
+    Computed stats are only stored for backups that finished, which write
+    backup_summary.json last; a partial backup may still grow or be resumed.
+    """
+    try:
+        with open(backup_root / BACKUP_STATS_FILE, 'rb') as f:
+            return orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        if (backup_root / 'backup_summary.json').exists():
+            return write_backup_stats(backup_root)
+        return _compute_backup_stats(backup_root)
+
+
+def _isoformat(timestamp: Optional[str]) -> Optional[str]:
+    """Normalize a GraphQL timestamp to the isoformat() of PyGithub datetimes."""
+    if not timestamp:
+        return None
+    return datetime.fromisoformat(timestamp.replace('Z', '+00:00')).isoformat()
+
+
 class GitHubBackup:
     """Main backup class for GitHub accounts."""
     
@@ -38,8 +346,38 @@ class GitHubBackup:
         if not self.token:
             raise ValueError("GitHub token not provided and not found in settings")
             
-        self.github = Github(self.token)
+        # Maximum page size cuts list round-trips ~3x versus the default of 30
+        self.github = Github(self.token, per_page=100, pool_size=HTTP_POOL_SIZE)
         self.user = self.github.get_user()
+        self.previous_backup = None
+        
+        # Threads git uses to resolve deltas of received packs; unset leaves git's default
+        git_jobs = self.settings.get_git_clone_jobs()
+        self.git_options = ['-c', f'pack.threads={git_jobs}'] if git_jobs else []
+        
+        self.rate_limiter = RateLimiter(
+            threshold=self.settings.get_throttle_limit(),
+            pause=self.settings.get_throttle_pause()
+        )
+        
+        # Session for GraphQL requests that PyGithub doesn't cover, reusing
+        # pooled keep-alive connections instead of a TLS handshake per request
+        self.session = requests.Session()
+        self.session.headers.update({'Authorization': f'bearer {self.token}'})
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=HTTP_POOL_SIZE,
+            pool_maxsize=HTTP_POOL_SIZE * 2,
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=[502, 503, 504],
+                # GraphQL queries are read-only, so POSTs are safe to retry
+                allowed_methods=frozenset({'GET', 'POST'})
+            )
+        ))
+        self.session.hooks['response'].append(
+            lambda response, *args, **kwargs: self.rate_limiter.update_from_headers(response.headers)
+        )
         
         # Ensure backup directory exists
         self.backup_dir.mkdir(parents=True, exist_ok=True)
@@ -64,8 +402,8 @@ class GitHubBackup:
         
         self.logger.info("="*60)
         self.logger.info("Starting GitHub backup session")
-        self.logger.info(f"User: {self.user.login}")
-        self.logger.info(f"Backup directory: {self.backup_dir}")
+        self.logger.info("User: %s", self.user.login)
+        self.logger.info("Backup directory: %s", self.backup_dir)
         self.logger.info("="*60)
         
     def create_backup_structure(self):
@@ -83,85 +421,340 @@ class GitHubBackup:
             'settings'
         ]
         
-        for dir_name in directories:
-            (self.backup_root / dir_name).mkdir(parents=True, exist_ok=True)
+        os.makedirs(self.backup_root, exist_ok=True)
+        create_missing_dirs(self.backup_root, directories)
+            
+        self.logger.info("Created backup structure at %s", self.backup_root)
+        
+        self.previous_backup = self.find_previous_backup()
+        if self.previous_backup:
+            self.logger.info("Using previous backup %s for incremental fetches", self.previous_backup)
+        
+    def find_previous_backup(self) -> Optional[Path]:
+        """Find the most recent earlier backup of this account, if any."""
+        prefix = f"github_backup_{self.user.login}_"
+        candidates = [
+            d for d in self.backup_dir.iterdir()
+            if d.is_dir() and d.name.startswith(prefix) and d != self.backup_root
+        ]
+        # Timestamped names sort chronologically
+        return max(candidates, key=lambda d: d.name, default=None)
+        
+    def _previous_repo_dir(self, repo) -> Optional[Path]:
+        """Get the repository directory from the previous backup, if it has a git mirror."""
+        if not self.previous_backup:
+            return None
+            
+        previous_repo_dir = self.previous_backup / 'repositories' / repo.name
+        if not (previous_repo_dir / 'git' / 'HEAD').exists():
+            return None
+        return previous_repo_dir
+        
+    def _is_unchanged_since(self, repo, previous_repo_dir: Path) -> bool:
+        """Check whether the repository has not been pushed to since the previous backup's mirror synced.
+        
+        metadata.json is written even when the clone fails, so only the marker
+        left by a successful sync vouches for the mirror's contents.
+        """
+        if not repo.pushed_at:
+            return False
             
-        self.logger.info(f"Created backup structure at {self.backup_root}")
+        try:
+            synced_pushed_at = (previous_repo_dir / 'git' / SYNCED_PUSHED_AT_FILE).read_text()
+        except OSError:
+            return False
+            
+        return synced_pushed_at == repo.pushed_at.isoformat()
+        
+    @staticmethod
+    def _record_synced(repo, repo_dir: Path):
+        """Mark a mirror as in sync with the repository's current pushed_at."""
+        marker = repo_dir / SYNCED_PUSHED_AT_FILE
+        if not repo.pushed_at:
+            marker.unlink(missing_ok=True)
+            return
+        # Linked mirrors share the marker with the previous backup, so replace it instead of rewriting it
+        tmp_marker = marker.with_name(marker.name + '.tmp')
+        tmp_marker.write_text(repo.pushed_at.isoformat())
+        os.replace(tmp_marker, marker)
         
     def backup_user_metadata(self):
         """Backup user profile and account metadata."""
         console.print("[bold blue]Backing up user metadata...[/bold blue]")
         self.logger.info("Starting user metadata backup")
         
-        user_data = {
-            'login': self.user.login,
-            'name': self.user.name,
-            'email': self.user.email,
-            'bio': self.user.bio,
-            'blog': self.user.blog,
-            'location': self.user.location,
-            'company': self.user.company,
-            'avatar_url': self.user.avatar_url,
-            'created_at': self.user.created_at.isoformat() if self.user.created_at else None,
-            'updated_at': self.user.updated_at.isoformat() if self.user.updated_at else None,
-            'public_repos': self.user.public_repos,
-            'private_repos': self.user.total_private_repos,
-            'followers': self.user.followers,
-            'following': self.user.following,
-        }
+        # raw_data is the already completed /user response - no per-attribute lazy loads
+        raw_user = self.user.raw_data
+        user_data = {key: raw_user.get(field) for key, field in USER_PROFILE_FIELDS}
+        user_data['created_at'] = _isoformat(user_data['created_at'])
+        user_data['updated_at'] = _isoformat(user_data['updated_at'])
         
         profile_file = self.backup_root / 'metadata' / 'user_profile.json'
-        with open(profile_file, 'w') as f:
-            json.dump(user_data, f, indent=2)
-        self.logger.info(f"Saved user profile to {profile_file}")
+        write_json(profile_file, user_data)
+        self.logger.info("Saved user profile to %s", profile_file)
             
         # Backup SSH keys
         try:
+            self._throttle_pygithub()
             keys = self.user.get_keys()
             ssh_keys = [{'id': key.id, 'key': key.key, 'title': key.title} for key in keys]
-            with open(self.backup_root / 'settings' / 'ssh_keys.json', 'w') as f:
-                json.dump(ssh_keys, f, indent=2)
+            write_json(self.backup_root / 'settings' / 'ssh_keys.json', ssh_keys)
         except GithubException as e:
-            self.logger.warning(f"Could not backup SSH keys: {e}")
+            self.logger.warning("Could not backup SSH keys: %s", e)
             
+    def _throttle_pygithub(self):
+        """Throttle before a PyGithub call using the rate limit seen on its last response."""
+        remaining, _ = self.github.rate_limiting
+        self.rate_limiter.update('core', remaining, self.github.rate_limiting_resettime)
+        self.rate_limiter.acquire('core')
+        
     def get_all_repositories(self) -> List:
         """Get all repositories (public and private) for the user."""
         repos = []
+        self._throttle_pygithub()
         
-        # Get owned repositories
-        for repo in self.user.get_repos(type='all'):
+        # Get owned repositories, most recently pushed first
+        for repo in self.user.get_repos(type='all', sort='pushed'):
             repos.append(repo)
             
         return repos
         
+    def _run_git(self, *args: str) -> subprocess.CompletedProcess:
+        """Run a git command, failing instead of prompting for credentials."""
+        return subprocess.run(
+            ['git', *self.git_options, *args],
+            check=True,
+            capture_output=True,
+            text=True,
+            env={**os.environ, 'GIT_TERMINAL_PROMPT': '0'}
+        )
+        
     def clone_repository(self, repo, repo_dir: Path):
-        """Clone a repository with all branches and history."""
+        """Clone a repository with all branches and history.
+        
+        Existing mirrors are updated with an incremental fetch. New mirrors are
+        seeded from the previous backup when available, so only new objects
+        are downloaded from GitHub, and repositories not pushed to since then
+        are hardlinked from it without contacting GitHub at all. With a clone
+        filter configured, partial clones are made instead and missing objects
+        are fetched on demand.
+        """
+        full_name = repo.full_name
         try:
-            clone_url = f"https://{self.token}@github.com/{repo.full_name}.git"
+            clone_url = f"https://{self.token}@github.com/{full_name}.git"
             
-            self.logger.info(f"Cloning {repo.full_name} to {repo_dir}")
-            self.logger.info(f"Repository details: private={repo.private}, size={repo.size}KB")
+            self.logger.info("Cloning %s to %s", full_name, repo_dir)
+            self.logger.info("Repository details: private=%s, size=%sKB", repo.private, repo.size)
+            
+            if (repo_dir / 'HEAD').exists():
+                # Mirror already present - only fetch what changed
+                self._run_git('--git-dir', str(repo_dir), 'fetch', '--prune', 'origin')
+                self._record_synced(repo, repo_dir)
+                self.logger.info("Fetched updates for %s", full_name)
+                return True
+                
+            clone_filter = self.settings.get_clone_filter()
+            
+            # Partial clones can't be seeded locally without their promisor remote
+            previous_repo_dir = None if clone_filter else self._previous_repo_dir(repo)
+            if previous_repo_dir and self._is_unchanged_since(repo, previous_repo_dir):
+                if self._link_previous_mirror(previous_repo_dir / 'git', repo_dir):
+                    self._run_git('--git-dir', str(repo_dir), 'remote', 'set-url', 'origin', clone_url)
+                    self.logger.info("No pushes to %s since last backup, linked previous mirror", full_name)
+                    return True
+                    
+            if previous_repo_dir:
+                # Local mirror clone hardlinks objects from the previous backup
+                self._run_git('clone', '--mirror', str(previous_repo_dir / 'git'), str(repo_dir))
+                self._run_git('--git-dir', str(repo_dir), 'remote', 'set-url', 'origin', clone_url)
+                self._run_git('--git-dir', str(repo_dir), 'fetch', '--prune', 'origin')
+                self._record_synced(repo, repo_dir)
+                self.logger.info("Fetched updates for %s on top of previous backup", full_name)
+                return True
+            
+            clone_options = ['--mirror']  # Mirror clone gets all refs
+            if clone_filter:
+                # e.g. blob:none - only commits and trees are downloaded up front
+                clone_options.append(f'--filter={clone_filter}')
             
             # Clone with all branches
-            local_repo = Repo.clone_from(
-                clone_url, 
-                repo_dir,
-                multi_options=['--mirror']  # Mirror clone gets all refs
-            )
+            self._run_git('clone', *clone_options, clone_url, str(repo_dir))
+            
+            if self.settings.get_repack_after_clone():
+                # Trade CPU for the smallest on-disk packs
+                self._run_git('--git-dir', str(repo_dir), 'repack', '-a', '-d', '--depth=250', '--window=250')
             
-            self.logger.info(f"Successfully cloned {repo.full_name}")
+            self._record_synced(repo, repo_dir)
+            self.logger.info("Successfully cloned %s", full_name)
             return True
             
-        except GitCommandError as e:
-            self.logger.error(f"Git command failed for {repo.full_name}: {str(e)}")
-            self.logger.error(f"Command output: {e.stderr if hasattr(e, 'stderr') else 'No stderr available'}")
+        except subprocess.CalledProcessError as e:
+            # The command line embeds the token, so only the exit status and output are logged
+            self.logger.error("Git command failed for %s with exit status %s", full_name, e.returncode)
+            self.logger.error("Command output: %s", e.stderr.strip() if e.stderr else 'No stderr available')
             return False
         except Exception as e:
-            self.logger.error(f"Unexpected error cloning {repo.full_name}: {type(e).__name__}: {str(e)}")
+            self.logger.error("Unexpected error cloning %s: %s: %s", full_name, type(e).__name__, e)
+            return False
+            
+    def _link_previous_mirror(self, previous_git_dir: Path, repo_dir: Path) -> bool:
+        """Hardlink every file of a previous mirror into repo_dir, without running git.
+        
+        Git replaces refs, packs and config through new files rather than
+        rewriting them in place, so later fetches never alter the previous backup.
+        """
+        try:
+            shutil.copytree(previous_git_dir, repo_dir, copy_function=os.link)
+            return True
+        except (OSError, shutil.Error) as e:
+            # e.g. backups on different filesystems - fall back to a local clone
+            self.logger.warning("Could not link previous mirror %s: %s", previous_git_dir, e)
+            shutil.rmtree(repo_dir, ignore_errors=True)
             return False
             
+    def _graphql(self, query: str, variables: Dict) -> Dict:
+        """Run a GraphQL query against the GitHub API and return its data."""
+        self.rate_limiter.acquire('graphql')
+        response = self.session.post(GRAPHQL_URL, json={'query': query, 'variables': variables})
+        response.raise_for_status()
+        
+        payload = response.json()
+        if payload.get('errors'):
+            raise GraphQLError(payload['errors'][0].get('message', 'Unknown GraphQL error'))
+        return payload['data']
+        
+    def _fetch_remaining_nodes(self, node: Dict, connection: str):
+        """Follow the cursor of a nested connection until all of its pages are loaded."""
+        page_info = node[connection]['pageInfo']
+        
+        while page_info['hasNextPage']:
+            data = self._graphql(NODE_CONNECTION_QUERY, {'id': node['id'], 'cursor': page_info['endCursor']})
+            page = data['node'][connection]
+            node[connection]['nodes'].extend(page['nodes'])
+            page_info = page['pageInfo']
+            
+    def _reuse_if_unchanged(self, repo, repo_dir: Path, filename: str) -> Tuple[bool, Optional[str]]:
+        """Copy a metadata file from the previous backup if its endpoint returns 304 Not Modified.
+        
+        Conditional requests answered with 304 don't count against the rate limit.
+        The ETag is only sent when the previous file has one stored next to it, so
+        a 304 always vouches for the exact file being copied. Returns whether the
+        file was reused, and otherwise the ETag to store once the file has been rewritten.
+        """
+        url_template, requires_single_page = CONDITIONAL_ENDPOINTS[filename]
+        url = url_template.format(full_name=repo.full_name)
+        
+        # The previous backup may have been written with or without compression
+        previous_file = None
+        if self.previous_backup:
+            previous_repo_dir = self.previous_backup / 'repositories' / repo.name
+            previous_file = next(
+                (path for path in (previous_repo_dir / f"{filename}.zst", previous_repo_dir / filename) if path.exists()),
+                None
+            )
+        etag = None
+        if previous_file:
+            try:
+                etag = (previous_file.parent / f"{filename}{ETAG_SUFFIX}").read_text()
+            except OSError:
+                pass
+        
+        try:
+            self.rate_limiter.acquire('core')
+            response = self.session.get(url, headers={'If-None-Match': etag} if etag else {})
+        except requests.RequestException as e:
+            self.logger.warning("Conditional request for %s failed: %s", url, e)
+            return False, None
+            
+        if response.status_code == 304:
+            shutil.copy2(previous_file, repo_dir / previous_file.name)
+            self._store_etag(repo_dir, filename, etag)
+            self.logger.info("%s unchanged for %s, reused previous backup", filename, repo.full_name)
+            return True, None
+            
+        if not response.ok or (requires_single_page and 'next' in response.links):
+            return False, None
+        return False, response.headers.get('ETag')
+        
+    def _repository_query_variables(self, repo, **overrides) -> Dict:
+        """Build REPOSITORY_METADATA_QUERY variables with every connection excluded by default."""
+        owner, name = repo.full_name.split('/', 1)
+        variables = {
+            'owner': owner,
+            'name': name,
+            'issuesCursor': None,
+            'pullRequestsCursor': None,
+            'releasesCursor': None,
+            'withIssues': False,
+            'withPullRequests': False,
+            'withReleases': False,
+        }
+        variables.update(overrides)
+        return variables
+        
+    def _query_repository(self, repo, variables: Dict) -> Dict:
+        """Run REPOSITORY_METADATA_QUERY and return the repository object."""
+        repository = self._graphql(REPOSITORY_METADATA_QUERY, variables)['repository']
+        if repository is None:
+            raise GraphQLError(f"Repository {repo.full_name} not found")
+        return repository
+        
+    def _iter_connection(self, repo, connection: str, nested: str, page: Dict) -> Iterator[Dict]:
+        """Yield the nodes of a repository connection, requesting further pages as they are consumed."""
+        cursor_variable, include_variable = CONNECTION_VARIABLES[connection]
+        
+        while True:
+            for node in page['nodes']:
+                self._fetch_remaining_nodes(node, nested)
+                yield node
+                
+            if not page['pageInfo']['hasNextPage']:
+                return
+                
+            variables = self._repository_query_variables(
+                repo, **{include_variable: True, cursor_variable: page['pageInfo']['endCursor']}
+            )
+            page = self._query_repository(repo, variables)[connection]
+            
+    def fetch_repository_metadata(self, repo, issues: bool = True, releases: bool = True) -> Dict:
+        """Fetch issues, pull requests and releases using GraphQL.
+        
+        A single query returns the first page of every requested connection, and
+        no query is made when nothing is requested. Issues, pull requests and
+        releases are returned as iterators that only request further pages while
+        being consumed, so large repositories are never held in memory as a whole.
+        """
+        if not (issues or releases):
+            return {'issues': iter(()), 'pullRequests': iter(()), 'releases': iter(())}
+            
+        variables = self._repository_query_variables(
+            repo, withIssues=issues, withPullRequests=issues, withReleases=releases
+        )
+        repository = self._query_repository(repo, variables)
+        
+        result = {}
+        for connection, nested, wanted in (
+            ('issues', 'comments', issues),
+            ('pullRequests', 'comments', issues),
+            ('releases', 'releaseAssets', releases),
+        ):
+            result[connection] = self._iter_connection(repo, connection, nested, repository[connection]) if wanted else iter(())
+            
+        return result
+        
     def backup_repository_metadata(self, repo, repo_dir: Path):
         """Backup repository metadata (issues, PRs, releases, etc.)."""
+        issues_reused, issues_etag = self._reuse_if_unchanged(repo, repo_dir, 'issues.json')
+        releases_reused, releases_etag = self._reuse_if_unchanged(repo, repo_dir, 'releases.json')
+        
+        try:
+            graphql_data = self.fetch_repository_metadata(
+                repo, issues=not issues_reused, releases=not releases_reused
+            )
+        except (requests.RequestException, GraphQLError) as e:
+            self.logger.warning("Could not fetch issues and releases for %s: %s", repo.full_name, e)
+            graphql_data = None
+            
         metadata = {
             'name': repo.name,
             'full_name': repo.full_name,
@@ -175,80 +768,186 @@ class GitHubBackup:
             'ssh_url': repo.ssh_url,
             'homepage': repo.homepage,
             'language': repo.language,
-            'topics': repo.get_topics(),
+            # Included in the repository list response, no extra request needed
+            'topics': repo.topics or [],
             'default_branch': repo.default_branch,
             'archived': repo.archived,
             'disabled': repo.disabled,
         }
         
         # Save basic metadata
-        with open(repo_dir / 'metadata.json', 'w') as f:
-            json.dump(metadata, f, indent=2)
+        write_json(repo_dir / 'metadata.json', metadata)
             
-        # Backup issues
-        try:
-            issues = []
-            for issue in repo.get_issues(state='all'):
-                issue_data = {
-                    'number': issue.number,
-                    'title': issue.title,
-                    'body': issue.body,
-                    'state': issue.state,
-                    'created_at': issue.created_at.isoformat() if issue.created_at else None,
-                    'updated_at': issue.updated_at.isoformat() if issue.updated_at else None,
-                    'closed_at': issue.closed_at.isoformat() if issue.closed_at else None,
-                    'user': issue.user.login if issue.user else None,
-                    'labels': [label.name for label in issue.labels],
-                    'comments': [
-                        {
-                            'user': comment.user.login if comment.user else None,
-                            'body': comment.body,
-                            'created_at': comment.created_at.isoformat() if comment.created_at else None
-                        }
-                        for comment in issue.get_comments()
-                    ]
-                }
-                issues.append(issue_data)
-                
-            with open(repo_dir / 'issues.json', 'w') as f:
-                json.dump(issues, f, indent=2)
+        if graphql_data is None:
+            return
+            
+        if not issues_reused:
+            # The REST issues list included pull requests, newest first
+            issue_nodes = heapq.merge(
+                graphql_data['issues'],
+                graphql_data['pullRequests'],
+                key=lambda node: node['number'],
+                reverse=True
+            )
+            issues = (self._issue_data(node) for node in issue_nodes)
+            written = self._write_metadata_stream(repo, repo_dir / 'issues.json', issues)
+            self._store_etag(repo_dir, 'issues.json', issues_etag if written else None)
                 
-        except GithubException as e:
-            self.logger.warning(f"Could not backup issues for {repo.full_name}: {e}")
+        if not releases_reused:
+            releases = (self._release_data(node) for node in graphql_data['releases'])
+            written = self._write_metadata_stream(repo, repo_dir / 'releases.json', releases)
+            self._store_etag(repo_dir, 'releases.json', releases_etag if written else None)
+            
+    def _write_metadata_stream(self, repo, path: Path, items: Iterator[Dict]) -> bool:
+        """Stream lazily fetched metadata into a JSON file, dropping it if a later page fails.
+        
+        The file gets a .zst suffix and is compressed when compress_metadata is enabled.
+        """
+        compress = self.settings.get_compress_metadata()
+        if compress:
+            path = path.with_name(f"{path.name}.zst")
             
-        # Backup releases
         try:
-            releases = []
-            for release in repo.get_releases():
-                release_data = {
-                    'tag_name': release.tag_name,
-                    'name': release.title,
-                    'body': release.body,
-                    'draft': release.draft,
-                    'prerelease': release.prerelease,
-                    'created_at': release.created_at.isoformat() if release.created_at else None,
-                    'published_at': release.published_at.isoformat() if release.published_at else None,
-                    'assets': [
-                        {
-                            'name': asset.name,
-                            'download_url': asset.browser_download_url,
-                            'size': asset.size
-                        }
-                        for asset in release.get_assets()
-                    ]
+            write_json_stream(path, items, compress=compress)
+            return True
+        except (requests.RequestException, GraphQLError) as e:
+            path.unlink(missing_ok=True)
+            self.logger.warning("Could not backup %s for %s: %s", path.name, repo.full_name, e)
+            return False
+            
+    @staticmethod
+    def _store_etag(repo_dir: Path, filename: str, etag: Optional[str]):
+        """Store the ETag a metadata file was written for next to it, or drop a stale one."""
+        etag_file = repo_dir / f"{filename}{ETAG_SUFFIX}"
+        if etag:
+            etag_file.write_text(etag)
+        else:
+            etag_file.unlink(missing_ok=True)
+            
+    @staticmethod
+    def _issue_data(node: Dict) -> Dict:
+        """Convert a GraphQL issue or pull request node to its backup format."""
+        return {
+            'number': node['number'],
+            'title': node['title'],
+            'body': node['body'],
+            'state': 'open' if node['state'] == 'OPEN' else 'closed',
+            'created_at': _isoformat(node['createdAt']),
+            'updated_at': _isoformat(node['updatedAt']),
+            'closed_at': _isoformat(node['closedAt']),
+            'user': node['author']['login'] if node['author'] else None,
+            'labels': [label['name'] for label in node['labels']['nodes']],
+            'comments': [
+                {
+                    'user': comment['author']['login'] if comment['author'] else None,
+                    'body': comment['body'],
+                    'created_at': _isoformat(comment['createdAt'])
+                }
+                for comment in node['comments']['nodes']
+            ]
+        }
+        
+    @staticmethod
+    def _release_data(node: Dict) -> Dict:
+        """Convert a GraphQL release node to its backup format."""
+        return {
+            'tag_name': node['tagName'],
+            'name': node['name'],
+            'body': node['description'],
+            'draft': node['isDraft'],
+            'prerelease': node['isPrerelease'],
+            'created_at': _isoformat(node['createdAt']),
+            'published_at': _isoformat(node['publishedAt']),
+            'assets': [
+                {
+                    'name': asset['name'],
+                    'download_url': asset['downloadUrl'],
+                    'size': asset['size']
                 }
-                releases.append(release_data)
+                for asset in node['releaseAssets']['nodes']
+            ]
+        }
+        
+    def iter_repository_backups(self, repos: List, cancel: Optional[threading.Event] = None):
+        """Back up repositories concurrently, yielding (repo, cloned, metadata_saved) as each one completes.
+        
+        Clones are bound by git transfer while metadata is bound by API latency,
+        so they run side by side in two thread pools, each sized by the
+        parallel workers setting. Setting cancel, or closing the generator,
+        drops the repositories not started yet; ones already running are
+        finished before the generator returns.
+        """
+        workers = max(1, self.settings.get_parallel_workers())
+        
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='clone') as clone_pool, \
+                ThreadPoolExecutor(max_workers=workers, thread_name_prefix='metadata') as metadata_pool:
+            clone_futures = {}
+            metadata_futures = {}
+            
+            repos_root = self.backup_root / 'repositories'
+            create_missing_dirs(repos_root, [repo.name for repo in repos])
+            
+            for repo in repos:
+                self.logger.info("Processing repository: %s", repo.full_name)
                 
-            with open(repo_dir / 'releases.json', 'w') as f:
-                json.dump(releases, f, indent=2)
+                repo_dir = repos_root / repo.name
+                clone_futures[clone_pool.submit(self.clone_repository, repo, repo_dir / 'git')] = repo
+                metadata_futures[metadata_pool.submit(self.backup_repository_metadata, repo, repo_dir)] = repo
                 
-        except GithubException as e:
-            self.logger.warning(f"Could not backup releases for {repo.full_name}: {e}")
+            remaining = {repo.full_name: 2 for repo in repos}
+            cloned = {}
+            metadata_saved = {}
             
-    def backup_repositories(self):
-        """Backup all repositories with metadata."""
+            pending = {*clone_futures, *metadata_futures}
+            try:
+                while pending:
+                    done, pending = wait(
+                        pending, timeout=CANCEL_POLL_INTERVAL if cancel else None, return_when=FIRST_COMPLETED
+                    )
+                    if cancel is not None and cancel.is_set():
+                        self.logger.info("Repository backup cancelled")
+                        return
+                        
+                    for future in done:
+                        repo = clone_futures.get(future) or metadata_futures[future]
+                        full_name = repo.full_name
+                        
+                        if future in clone_futures:
+                            try:
+                                cloned[full_name] = future.result()
+                            except Exception as e:
+                                self.logger.error("Unexpected error cloning %s: %s: %s", full_name, type(e).__name__, e)
+                                cloned[full_name] = False
+                                
+                            if cloned[full_name]:
+                                self.logger.info("Successfully cloned %s", full_name)
+                            else:
+                                self.logger.error("Failed to clone %s", full_name)
+                        else:
+                            try:
+                                future.result()
+                                metadata_saved[full_name] = True
+                                self.logger.info("Backed up metadata for %s", full_name)
+                            except Exception as e:
+                                metadata_saved[full_name] = False
+                                self.logger.error("Failed to backup metadata for %s: %s: %s", full_name, type(e).__name__, e)
+                                
+                        remaining[full_name] -= 1
+                        if not remaining[full_name]:
+                            yield repo, cloned[full_name], metadata_saved[full_name]
+            finally:
+                # Queued work is dropped; the pools only wait for what is already running
+                for future in pending:
+                    future.cancel()
+                    
+    def backup_repositories(self, progress_callback: Optional[Callable[[int, int, object, bool], None]] = None):
+        """Backup all repositories with metadata.
+        
+        progress_callback, if given, is called as (completed, total, repo, cloned)
+        after each repository finishes.
+        """
         repos = self.get_all_repositories()
-        self.logger.info(f"Starting backup of {len(repos)} repositories")
+        self.logger.info("Starting backup of %s repositories", len(repos))
         
         clone_success = 0
         clone_failures = 0
@@ -264,39 +963,32 @@ class GitHubBackup:
             
             task = progress.add_task("Backing up repositories...", total=len(repos))
             
-            for repo in repos:
-                self.logger.info(f"Processing repository: {repo.full_name}")
-                progress.update(task, description=f"Backing up {repo.full_name}")
-                
-                repo_dir = self.backup_root / 'repositories' / repo.name
-                repo_dir.mkdir(exist_ok=True)
+            for repo, cloned, _ in self.iter_repository_backups(repos):
+                progress.update(task, description=f"Backed up {repo.full_name}")
                 
-                # Clone repository
-                if self.clone_repository(repo, repo_dir / 'git'):
+                if cloned:
                     console.print(f"✓ Cloned {repo.full_name}")
-                    self.logger.info(f"Successfully cloned {repo.full_name}")
                     clone_success += 1
                 else:
                     console.print(f"✗ Failed to clone {repo.full_name}", style="red")
-                    self.logger.error(f"Failed to clone {repo.full_name}")
                     clone_failures += 1
                     
-                # Backup metadata
-                self.logger.info(f"Backing up metadata for {repo.full_name}")
-                self.backup_repository_metadata(repo, repo_dir)
-                
                 progress.advance(task)
+                
+                if progress_callback:
+                    progress_callback(clone_success + clone_failures, len(repos), repo, cloned)
         
-        self.logger.info(f"Repository backup completed: {clone_success} successful, {clone_failures} failed")
+        self.logger.info("Repository backup completed: %s successful, %s failed", clone_success, clone_failures)
                 
     def backup_gists(self):
         """Backup all user gists."""
         console.print("[bold blue]Backing up gists...[/bold blue]")
         
+        gists_file = self.backup_root / 'gists' / 'gists.json'
         try:
-            gists = []
-            for gist in self.user.get_gists():
-                gist_data = {
+            self._throttle_pygithub()
+            gists = (
+                {
                     'id': gist.id,
                     'description': gist.description,
                     'public': gist.public,
@@ -311,15 +1003,15 @@ class GitHubBackup:
                         for filename, file in gist.files.items()
                     }
                 }
-                gists.append(gist_data)
-                
-            with open(self.backup_root / 'gists' / 'gists.json', 'w') as f:
-                json.dump(gists, f, indent=2)
+                for gist in self.user.get_gists()
+            )
+            gist_count = write_json_stream(gists_file, gists)
                 
-            console.print(f"✓ Backed up {len(gists)} gists")
+            console.print(f"✓ Backed up {gist_count} gists")
             
         except GithubException as e:
-            self.logger.error(f"Failed to backup gists: {e}")
+            gists_file.unlink(missing_ok=True)
+            self.logger.error("Failed to backup gists: %s", e)
             
     def run_backup(self):
         """Run the complete backup process."""
@@ -345,8 +1037,8 @@ class GitHubBackup:
                 'status': 'completed'
             }
             
-            with open(self.backup_root / 'backup_summary.json', 'w') as f:
-                json.dump(summary, f, indent=2)
+            write_json(self.backup_root / 'backup_summary.json', summary)
+            write_backup_stats(self.backup_root)
                 
             console.print(Panel.fit(
                 f"[bold green]Backup Completed Successfully![/bold green]\n"
@@ -357,7 +1049,7 @@ class GitHubBackup:
             ))
             
         except Exception as e:
-            self.logger.error(f"Backup failed: {e}")
+            self.logger.error("Backup failed: %s", e)
             console.print(f"[bold red]Backup failed: {e}[/bold red]")
             raise
 
@@ -370,7 +1062,9 @@ def cli():
 @click.option('--token', '-t', help='GitHub personal access token (optional if set in settings)')
 @click.option('--backup-dir', '-d', help='Backup directory path (optional if set in settings)')
 @click.option('--dry-run', is_flag=True, help='Show what would be backed up without doing it')
-def backup(token: str, backup_dir: str, dry_run: bool):
+@click.option('--throttle-limit', type=int, help='Start throttling API requests below this many remaining (saved to settings)')
+@click.option('--throttle-pause', type=float, help='Minimum pause in seconds between throttled requests (saved to settings)')
+def backup(token: str, backup_dir: str, dry_run: bool, throttle_limit: int, throttle_pause: float):
     """Backup your GitHub account - repositories, issues, PRs, gists, and metadata."""
     
     if dry_run:
@@ -379,7 +1073,13 @@ def backup(token: str, backup_dir: str, dry_run: bool):
         return
         
     try:
-        backup_tool = GitHubBackup(token, backup_dir)
+        settings_mgr = SettingsManager()
+        if throttle_limit is not None:
+            settings_mgr.set_throttle_limit(throttle_limit)
+        if throttle_pause is not None:
+            settings_mgr.set_throttle_pause(throttle_pause)
+            
+        backup_tool = GitHubBackup(token, backup_dir, settings_manager=settings_mgr)
         backup_tool.run_backup()
         
     except Exception as e:
@@ -459,19 +1159,18 @@ def setup():
         title="Setup"
     ))
     
-    # GitHub token
     token = click.prompt("GitHub Personal Access Token", hide_input=True)
-    settings_mgr.set_github_token(token)
-    console.print("✓ GitHub token saved (encrypted)")
-    
-    # Backup directory
     backup_dir = click.prompt("Default backup directory", default="./backups")
-    settings_mgr.set_backup_directory(backup_dir)
-    console.print(f"✓ Backup directory set to {backup_dir}")
-    
-    # Parallel workers
     workers = click.prompt("Number of parallel workers", default=4, type=int)
-    settings_mgr.set_parallel_workers(workers)
+    
+    # Save all answers in one transaction
+    settings_mgr.set_many({
+        'github_token': (token, True, 'GitHub Personal Access Token'),
+        'backup_directory': (backup_dir, False, 'Default backup directory path'),
+        'parallel_workers': (workers, False, 'Number of parallel backup workers'),
+    })
+    console.print("✓ GitHub token saved (encrypted)")
+    console.print(f"✓ Backup directory set to {backup_dir}")
     console.print(f"✓ Parallel workers set to {workers}")
     
     console.print("\n[bold green]Setup complete![/bold green] You can now run:\n")
@@ -5,37 +5,70 @@ Securely stores tokens, paths, and configuration.
 """
 
 import sqlite3
-import json
+import orjson
 from pathlib import Path
-from typing import Any, Optional, Dict
+from typing import Any, Optional, Dict, Tuple
 from cryptography.fernet import Fernet
 import base64
 import os
+import threading
+from functools import lru_cache
+
+# Marks keys known to be absent in the value cache
+_MISSING = object()
+
+# History kept when extracting repositories from a backup; the first is the default
+EXTRACT_DEPTHS = ('full', 'latest', 'checkout-only')
+
+
+@lru_cache(maxsize=None)
+def _read_or_create_key(key_file: Path) -> bytes:
+    """Read the encryption key file, creating it on first use."""
+    if key_file.exists():
+        return key_file.read_bytes()
+        
+    key = Fernet.generate_key()
+    key_file.write_bytes(key)
+    key_file.chmod(0o600)  # Restrict permissions
+    return key
+
 
 class SettingsManager:
     """Secure settings storage using SQLite with encryption for sensitive data."""
     
+    # Locks and decoded-value caches shared by every manager of the same database,
+    # so a write through any instance invalidates cached reads in all of them
+    _shared_state: Dict[Path, tuple] = {}
+    _shared_state_lock = threading.Lock()
+    
     def __init__(self, db_path: str = "settings.db"):
         self.db_path = Path(db_path)
         self.encryption_key = self._get_or_create_encryption_key()
         self.cipher = Fernet(self.encryption_key)
+        
+        with SettingsManager._shared_state_lock:
+            self._lock, self._cache = SettingsManager._shared_state.setdefault(
+                self.db_path.resolve(), (threading.Lock(), {})
+            )
+        
+        # One connection per manager; transactions are serialized by the lock
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
         self._init_database()
         
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+        
     def _get_or_create_encryption_key(self) -> bytes:
         """Get or create encryption key for sensitive data."""
-        key_file = self.db_path.parent / ".key"
-        
-        if key_file.exists():
-            return key_file.read_bytes()
-        else:
-            key = Fernet.generate_key()
-            key_file.write_bytes(key)
-            key_file.chmod(0o600)  # Restrict permissions
-            return key
+        return _read_or_create_key(self.db_path.parent.resolve() / ".key")
             
     def _init_database(self):
         """Initialize the settings database with required tables."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock, self._conn as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS settings (
                     key TEXT PRIMARY KEY,
@@ -57,8 +90,6 @@ class SettingsManager:
                 )
             """)
             
-            conn.commit()
-            
     def _encrypt_value(self, value: str) -> str:
         """Encrypt sensitive values."""
         return self.cipher.encrypt(value.encode()).decode()
@@ -67,31 +98,53 @@ class SettingsManager:
         """Decrypt sensitive values."""
         return self.cipher.decrypt(encrypted_value.encode()).decode()
         
-    def set(self, key: str, value: Any, encrypted: bool = False, description: str = None):
-        """Set a configuration value."""
-        str_value = json.dumps(value) if not isinstance(value, str) else value
+    def _encode_value(self, value: Any, encrypted: bool) -> str:
+        """Serialize and optionally encrypt a value for storage."""
+        str_value = orjson.dumps(value).decode() if not isinstance(value, str) else value
         
         if encrypted:
             str_value = self._encrypt_value(str_value)
-            
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
+        return str_value
+        
+    def set(self, key: str, value: Any, encrypted: bool = False, description: str = None):
+        """Set a configuration value."""
+        self.set_many({key: (value, encrypted, description)})
+        
+    def set_many(self, items: Dict[str, Tuple[Any, bool, Optional[str]]]):
+        """Set several configuration values in a single transaction.
+        
+        items maps each key to a (value, encrypted, description) tuple.
+        """
+        rows = [
+            (key, self._encode_value(value, encrypted), encrypted, description)
+            for key, (value, encrypted, description) in items.items()
+        ]
+        
+        with self._lock, self._conn as conn:
+            conn.executemany("""
                 INSERT OR REPLACE INTO settings (key, value, encrypted, description, updated_at)
                 VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
-            """, (key, str_value, encrypted, description))
-            conn.commit()
+            """, rows)
+            for key in items:
+                self._cache.pop(key, None)
             
     def get(self, key: str, default: Any = None) -> Any:
-        """Get a configuration value."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
-                "SELECT value, encrypted FROM settings WHERE key = ?", (key,)
-            )
-            row = cursor.fetchone()
-            
-        if not row:
-            return default
-            
+        """Get a configuration value (decoded values are cached in-process)."""
+        with self._lock:
+            if key not in self._cache:
+                with self._conn as conn:
+                    cursor = conn.execute(
+                        "SELECT value, encrypted FROM settings WHERE key = ?", (key,)
+                    )
+                    row = cursor.fetchone()
+                    
+                self._cache[key] = self._decode_row(row) if row else _MISSING
+            value = self._cache[key]
+                
+        return default if value is _MISSING else value
+        
+    def _decode_row(self, row) -> Any:
+        """Decrypt and parse a stored settings value."""
         value, encrypted = row
         
         if encrypted:
@@ -99,20 +152,20 @@ class SettingsManager:
             
         # Try to parse as JSON, fallback to string
         try:
-            return json.loads(value)
-        except (json.JSONDecodeError, TypeError):
+            return orjson.loads(value)
+        except (orjson.JSONDecodeError, TypeError):
             return value
             
     def delete(self, key: str) -> bool:
         """Delete a configuration value."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock, self._conn as conn:
             cursor = conn.execute("DELETE FROM settings WHERE key = ?", (key,))
-            conn.commit()
+            self._cache.pop(key, None)
             return cursor.rowcount > 0
             
     def list_settings(self) -> Dict[str, Dict[str, Any]]:
         """List all settings (without decrypting sensitive values)."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock, self._conn as conn:
             cursor = conn.execute("""
                 SELECT key, encrypted, description, created_at, updated_at
                 FROM settings ORDER BY key
@@ -132,35 +185,33 @@ class SettingsManager:
         
     def create_profile(self, name: str, settings_dict: Dict[str, Any]):
         """Create a settings profile."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock, self._conn as conn:
             conn.execute("""
                 INSERT OR REPLACE INTO profiles (name, settings, updated_at)
                 VALUES (?, ?, CURRENT_TIMESTAMP)
-            """, (name, json.dumps(settings_dict)))
-            conn.commit()
+            """, (name, orjson.dumps(settings_dict).decode()))
             
     def load_profile(self, name: str) -> Optional[Dict[str, Any]]:
         """Load a settings profile."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock, self._conn as conn:
             cursor = conn.execute("SELECT settings FROM profiles WHERE name = ?", (name,))
             row = cursor.fetchone()
             
         if row:
-            return json.loads(row[0])
+            return orjson.loads(row[0])
         return None
         
     def set_active_profile(self, name: str):
         """Set the active profile."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock, self._conn as conn:
             # Deactivate all profiles
             conn.execute("UPDATE profiles SET active = FALSE")
             # Activate the specified profile
             conn.execute("UPDATE profiles SET active = TRUE WHERE name = ?", (name,))
-            conn.commit()
             
     def get_active_profile(self) -> Optional[str]:
         """Get the active profile name."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock, self._conn as conn:
             cursor = conn.execute("SELECT name FROM profiles WHERE active = TRUE")
             row = cursor.fetchone()
             
@@ -197,4 +248,61 @@ class SettingsManager:
         
     def get_parallel_workers(self) -> int:
         """Get number of parallel workers."""
-        return self.get('parallel_workers', 4)
\ No newline at end of file
+        return self.get('parallel_workers', 4)
+        
+    def set_throttle_limit(self, remaining: int):
+        """Set the remaining API quota below which requests are throttled."""
+        self.set('throttle_limit', remaining, description='Throttle API requests below this remaining rate limit')
+        
+    def get_throttle_limit(self) -> int:
+        """Get the remaining API quota below which requests are throttled."""
+        return self.get('throttle_limit', 100)
+        
+    def set_throttle_pause(self, seconds: float):
+        """Set the minimum pause between throttled API requests."""
+        self.set('throttle_pause', seconds, description='Minimum pause in seconds between throttled API requests')
+        
+    def get_throttle_pause(self) -> float:
+        """Get the minimum pause between throttled API requests."""
+        return self.get('throttle_pause', 0.5)
+        
+    def set_clone_filter(self, clone_filter: Optional[str]):
+        """Set the partial clone filter (e.g. 'blob:none'), or None for full mirrors."""
+        self.set('clone_filter', clone_filter, description='Partial clone filter for repository backups')
+        
+    def get_clone_filter(self) -> Optional[str]:
+        """Get the partial clone filter; None means full archive-grade mirrors."""
+        return self.get('clone_filter')
+        
+    def set_repack_after_clone(self, enabled: bool):
+        """Set whether new clones are aggressively repacked."""
+        self.set('repack_after_clone', enabled, description='Repack new clones for maximum compression')
+        
+    def get_repack_after_clone(self) -> bool:
+        """Get whether new clones are aggressively repacked."""
+        return self.get('repack_after_clone', False)
+        
+    def set_compress_metadata(self, enabled: bool):
+        """Set whether issues and releases are stored zstd-compressed."""
+        self.set('compress_metadata', enabled, description='Store issues.json/releases.json zstd-compressed')
+        
+    def get_compress_metadata(self) -> bool:
+        """Get whether issues and releases are stored zstd-compressed."""
+        return self.get('compress_metadata', True)
+        
+    def set_git_clone_jobs(self, jobs: Optional[int]):
+        """Set the threads git uses to resolve deltas while cloning and fetching."""
+        self.set('git_clone_jobs', jobs, description='Threads git uses for delta resolution (empty for git default)')
+        
+    def get_git_clone_jobs(self) -> Optional[int]:
+        """Get the threads git uses to resolve deltas; None means git's default."""
+        return self.get('git_clone_jobs')
+        
+    def set_extract_depth(self, depth: str):
+        """Set how much history extraction checks out: 'full', 'latest' or 'checkout-only'."""
+        self.set('extract_depth', depth, description='History included when extracting repositories from a backup')
+        
+    def get_extract_depth(self) -> str:
+        """Get how much history extraction checks out, falling back to 'full' for unknown values."""
+        depth = self.get('extract_depth', EXTRACT_DEPTHS[0])
+        return depth if depth in EXTRACT_DEPTHS else EXTRACT_DEPTHS[0]
\ No newline at end of file
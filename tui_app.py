@@ -5,31 +5,207 @@ Modern TUI interface for GitHub account backup and management.
 """
 
 import asyncio
+import os
+import platform
+import shutil
+import subprocess
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache, partial
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical, ScrollableContainer
 from textual.widgets import (
     Header, Footer, Button, DataTable, Static, Input, Log, 
     TabbedContent, TabPane, Tree, ProgressBar, Label, Switch,
-    Select, RichLog
+    Select, RichLog, RadioSet, RadioButton
 )
 from textual.reactive import reactive
 from textual.message import Message
 from textual.binding import Binding
+from textual.coordinate import Coordinate
 from textual.screen import Screen
-from textual import events
+from textual import events, work
 from rich.text import Text
 from rich.table import Table as RichTable
 from rich.panel import Panel
 from rich.progress import Progress
 
-from github import Github, GithubException
+import orjson
+from github import Github, GithubException, RateLimitExceededException
+from github.Repository import Repository
 from settings import SettingsManager
-from github_backup import GitHubBackup
+from github_backup import (
+    GitHubBackup, dir_size, read_backup_stats, refresh_backup_stats, write_backup_stats, write_json
+)
+
+# Dashboard account overview, filled in by MainDashboard.load_account_info
+ACCOUNT_INFO_TEMPLATE = (
+    "👤 **{login}** ({name})\n"
+    "📧 {email}\n"
+    "📁 {public} public repos\n"
+    "🔐 {private} private repos\n"
+    "👥 {followers} followers, {following} following\n"
+    "📅 Joined {joined}"
+)
+
+# Repositories extracted from a backup at once; extraction is disk and subprocess bound
+EXTRACT_WORKERS = min(8, (os.cpu_count() or 1) * 2)
+
+# git clone arguments for each extraction depth. A full clone hardlinks the backup's objects,
+# so it keeps working when the repository is later deleted from the backup. The reduced depths
+# need --no-local, which goes through upload-pack; the backup's upload-pack is told to honour
+# the blob filter without changing the backup's config.
+EXTRACT_DEPTH_ARGS = {
+    "full": ['--local'],
+    "latest": ['--depth', '1', '--no-local'],
+    "checkout-only": [
+        '--filter=blob:none', '--no-local', '--upload-pack', 'git -c uploadpack.allowFilter=true upload-pack'
+    ],
+}
+
+# Credential helper answering with the token from the environment, so the token never appears
+# in a URL, the process list or git's error output. The empty helper drops any configured ones.
+_TOKEN_CREDENTIALS = [
+    '-c', 'credential.helper=',
+    '-c', 'credential.helper=!f() { echo username=x-access-token; echo "password=$GITKEEPER_TOKEN"; }; f',
+]
+
+# git output is only needed for error messages: discard stdout, keep stderr
+_QUIET = {'stdout': subprocess.DEVNULL, 'stderr': subprocess.PIPE}
+
+
+def _list_backups(backup_dir: Path) -> List[Path]:
+    """Return the backup directories in backup_dir, most recent first."""
+    # Adding, renaming or removing a backup changes the directory's mtime, which keys the cache
+    return list(_scan_backups(backup_dir, backup_dir.stat().st_mtime_ns))
+
+
+@lru_cache(maxsize=1)
+def _scan_backups(backup_dir: Path, mtime_ns: int) -> Tuple[Path, ...]:
+    """Scan backup_dir for backup directories, most recent first."""
+    # One scandir pass stats each entry once, instead of on every sort comparison
+    with os.scandir(backup_dir) as entries:
+        backups = [
+            (entry.stat().st_mtime, Path(entry.path)) for entry in entries
+            if entry.name.startswith("github_backup_") and entry.is_dir()
+        ]
+    backups.sort(reverse=True)
+    return tuple(path for _, path in backups)
+
+
+# Prefix of directories moved aside by _discard_tree until a background thread deletes them
+TRASH_PREFIX = '.trash-'
+
+
+def _discard_tree(path: Path, trash_dir: Path) -> None:
+    """Move a directory into trash_dir and delete it in a background thread.
+    
+    The rename is instant, so the caller can reuse path right away; trash_dir must be on
+    the same filesystem, and outside any backup whose stats are recomputed. Leftovers
+    from an interrupted delete are removed by _sweep_trash.
+    """
+    trash = trash_dir / f"{TRASH_PREFIX}{path.name}-{os.getpid()}-{time.time_ns()}"
+    os.rename(path, trash)
+    threading.Thread(target=shutil.rmtree, args=(trash,), kwargs={'ignore_errors': True}, daemon=True).start()
+
+
+def _sweep_trash(trash_dir: Path) -> None:
+    """Delete directories _discard_tree left in trash_dir when the app exited mid-delete."""
+    try:
+        with os.scandir(trash_dir) as it:
+            leftovers = [entry.path for entry in it if entry.name.startswith(TRASH_PREFIX)]
+    except FileNotFoundError:
+        return
+    for leftover in leftovers:
+        shutil.rmtree(leftover, ignore_errors=True)
+
+
+def _name_summary(names: List[str], limit: int = 5) -> str:
+    """Join the first few names for a notification, noting how many were left out."""
+    summary = ', '.join(sorted(names)[:limit])
+    if len(names) > limit:
+        summary += f" and {len(names) - limit} more"
+    return summary
+
+
+def _head_sha(git_dir: Path) -> Optional[str]:
+    """Return the commit HEAD points to in git_dir by reading refs directly, or None."""
+    head = (git_dir / 'HEAD').read_text().strip()
+    if not head.startswith('ref: '):
+        return head
+    ref = head[5:]
+    
+    try:
+        return (git_dir / ref).read_text().strip()
+    except FileNotFoundError:
+        pass
+    
+    # Mirror clones keep most refs in packed-refs
+    try:
+        with open(git_dir / 'packed-refs') as f:
+            for line in f:
+                sha, _, name = line.rstrip('\n').partition(' ')
+                if name == ref:
+                    return sha
+    except FileNotFoundError:
+        pass
+    return None
+
+
+def _commit_count(git_dir: Path, metadata_file: Path, metadata: Optional[Dict]) -> int:
+    """Return the number of commits reachable from HEAD, cached in metadata.json by HEAD's SHA.
+    
+    metadata is the parsed metadata.json, or None when the repository has none.
+    """
+    sha = _head_sha(git_dir)
+    # History behind a commit never changes, so a count for the same SHA is always valid
+    if sha and metadata is not None and metadata.get('commit_count_sha') == sha:
+        return metadata['commit_count']
+    
+    result = subprocess.run(
+        ['git', '--git-dir', str(git_dir), 'rev-list', '--count', 'HEAD'],
+        capture_output=True, text=True, check=True
+    )
+    count = int(result.stdout)
+    
+    if sha and metadata is not None:
+        metadata['commit_count'] = count
+        metadata['commit_count_sha'] = sha
+        write_json(metadata_file, metadata)
+    return count
+
+
+class _LogBatcher:
+    """Collect log lines and write them to a RichLog in batches.
+    
+    Every write schedules a refresh, so lines are flushed as one multi-line write
+    at most every `interval` seconds or once `max_lines` have accumulated.
+    """
+    
+    def __init__(self, log: RichLog, max_lines: int = 20, interval: float = 0.05) -> None:
+        self.log = log
+        self.max_lines = max_lines
+        self.interval = interval
+        self.lines: List[str] = []
+        self.last_flush = time.monotonic()
+    
+    def add(self, line: str) -> None:
+        """Queue a line, flushing if the batch is full or due."""
+        self.lines.append(line)
+        if len(self.lines) >= self.max_lines or time.monotonic() - self.last_flush >= self.interval:
+            self.flush()
+    
+    def flush(self) -> None:
+        """Write all queued lines to the log."""
+        if self.lines:
+            self.log.write("\n".join(self.lines))
+            self.lines = []
+        self.last_flush = time.monotonic()
 
 
 class SetupScreen(Screen):
@@ -83,7 +259,7 @@ class SetupScreen(Screen):
             self.notify("Please enter your GitHub token", severity="error")
             return
             
-        settings = SettingsManager()
+        settings = self.app.settings
         settings.set_github_token(token_input.value)
         settings.set_backup_directory(backup_dir_input.value)
         settings.set_parallel_workers(workers_select.value)
@@ -96,24 +272,26 @@ class SetupScreen(Screen):
         self.app.exit()
 
 
-class SelectiveBackupProgressScreen(Screen):
-    """Screen showing real-time selective backup progress."""
+class _BaseBackupProgressScreen(Screen):
+    """Shared layout and stage runner for the backup progress screens."""
     
     BINDINGS = [
         Binding("escape", "back", "Back to Dashboard"),
         Binding("ctrl+c", "cancel_backup", "Cancel Backup"),
     ]
     
-    def __init__(self, backup_tool: GitHubBackup, selected_repos: set) -> None:
+    title_text = "🔄 Backup in Progress"
+    backup_name = "Backup"
+    
+    def __init__(self, backup_tool: GitHubBackup) -> None:
         super().__init__()
         self.backup_tool = backup_tool
-        self.selected_repos = selected_repos
         self.backup_task = None
     
     def compose(self) -> ComposeResult:
         yield Header()
         yield Container(
-            Static(f"🔄 Selective Backup ({len(self.selected_repos)} repositories)", classes="title"),
+            Static(self.title_text, classes="title"),
             
             Container(
                 Static("Overall Progress:", classes="section_title"),
@@ -125,7 +303,7 @@ class SelectiveBackupProgressScreen(Screen):
                 Label("Waiting...", id="repo_status"),
                 
                 Static("Current Operation:", classes="section_title"),
-                Label("Starting selective backup...", id="current_operation"),
+                Label(f"Starting {self.backup_name.lower()}...", id="current_operation"),
                 
                 classes="progress_container"
             ),
@@ -146,62 +324,37 @@ class SelectiveBackupProgressScreen(Screen):
         yield Footer()
     
     def on_mount(self) -> None:
-        """Start the selective backup process when screen loads."""
-        self.backup_task = asyncio.create_task(self.run_selective_backup())
+        """Start the backup process when screen loads."""
+        self.backup_task = asyncio.create_task(self.run_backup())
     
-    async def run_selective_backup(self) -> None:
-        """Run the selective backup process with progress updates."""
+    def _steps(self) -> List[tuple]:
+        """Return the (progress, log line, status, stage) steps of this backup."""
+        raise NotImplementedError
+    
+    async def run_backup(self) -> None:
+        """Run the backup process stage by stage with progress updates."""
         log = self.query_one("#backup_log", RichLog)
         overall_progress = self.query_one("#overall_progress", ProgressBar)
         overall_status = self.query_one("#overall_status", Label)
-        repo_progress = self.query_one("#repo_progress", ProgressBar)
-        repo_status = self.query_one("#repo_status", Label)
         
         try:
-            log.write(f"🚀 Starting selective backup of {len(self.selected_repos)} repositories...")
-            overall_status.update("Initializing selective backup...")
-            overall_progress.update(progress=10)
-            
-            # Run the actual selective backup process
-            await asyncio.get_event_loop().run_in_executor(
-                None, self._run_selective_backup_sync, log, overall_progress, overall_status, repo_progress, repo_status
-            )
-            
-        except Exception as e:
-            log.write(f"❌ Selective backup failed: {str(e)}")
-            overall_status.update(f"Backup failed: {str(e)}")
-    
-    def _run_selective_backup_sync(self, log, overall_progress, overall_status, repo_progress, repo_status):
-        """Run the synchronous selective backup process."""
-        try:
-            # Create backup structure
-            log.write("📁 Creating backup directory structure...")
-            overall_status.update("Creating backup structure...")
-            overall_progress.update(progress=20)
-            self.backup_tool.create_backup_structure()
-            
-            # Backup user information
-            log.write("👤 Backing up user information...")
-            overall_status.update("Backing up user information...")
-            overall_progress.update(progress=30)
-            self.backup_tool.backup_user_metadata()
-            
-            # Backup selected repositories only
-            log.write(f"📦 Backing up {len(self.selected_repos)} selected repositories...")
-            overall_status.update("Backing up selected repositories...")
-            overall_progress.update(progress=40)
-            
-            # Call selective backup method
-            self._backup_selected_repositories(log, repo_progress, repo_status)
-            overall_progress.update(progress=85)
+            # Blocking stages run in a thread, coroutines run on the event loop;
+            # awaiting each one lets cancellation land between stages
+            for progress, message, status, stage in self._steps():
+                log.write(message)
+                overall_status.update(status)
+                overall_progress.update(progress=progress)
+                
+                if asyncio.iscoroutinefunction(stage):
+                    await stage()
+                elif stage:
+                    await asyncio.to_thread(stage)
             
-            # Skip gists for selective backup to keep it focused
-            log.write("📝 Skipping gists in selective backup...")
-            overall_status.update("Finalizing backup...")
-            overall_progress.update(progress=95)
+            # The backup won't change from here on, so history listings can reuse its stats
+            await asyncio.to_thread(write_backup_stats, self.backup_tool.backup_root)
             
-            log.write("✅ Selective backup completed successfully!")
-            overall_status.update("Selective backup completed successfully!")
+            log.write(f"✅ {self.backup_name} completed successfully!")
+            overall_status.update(f"{self.backup_name} completed successfully!")
             overall_progress.update(progress=100)
             
             # Change Cancel button to Close button
@@ -210,46 +363,8 @@ class SelectiveBackupProgressScreen(Screen):
             cancel_btn.variant = "success"
             
         except Exception as e:
-            log.write(f"❌ Selective backup failed: {str(e)}")
+            log.write(f"❌ {self.backup_name} failed: {str(e)}")
             overall_status.update(f"Backup failed: {str(e)}")
-            raise
-    
-    def _backup_selected_repositories(self, log, repo_progress, repo_status):
-        """Backup only the selected repositories."""
-        # Get all repositories and filter by selected ones
-        all_repos = self.backup_tool.get_all_repositories()
-        selected_repo_objects = [repo for repo in all_repos if repo.name in self.selected_repos]
-        
-        clone_success = 0
-        clone_failures = 0
-        total_repos = len(selected_repo_objects)
-        
-        repo_progress.update(total=total_repos * 100)
-        
-        for i, repo in enumerate(selected_repo_objects):
-            log.write(f"Processing repository: {repo.full_name}")
-            repo_status.update(f"Backing up {repo.full_name}")
-            
-            repo_dir = self.backup_tool.backup_root / 'repositories' / repo.name
-            repo_dir.mkdir(exist_ok=True)
-            
-            # Clone repository
-            if self.backup_tool.clone_repository(repo, repo_dir / 'git'):
-                log.write(f"✓ Cloned {repo.full_name}")
-                clone_success += 1
-            else:
-                log.write(f"✗ Failed to clone {repo.full_name}")
-                clone_failures += 1
-                
-            # Backup metadata
-            log.write(f"Backing up metadata for {repo.full_name}")
-            self.backup_tool.backup_repository_metadata(repo, repo_dir)
-            
-            # Update progress
-            progress_value = ((i + 1) / total_repos) * 100
-            repo_progress.update(progress=progress_value)
-        
-        log.write(f"Repository backup completed: {clone_success} successful, {clone_failures} failed")
     
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "cancel_btn":
@@ -265,7 +380,7 @@ class SelectiveBackupProgressScreen(Screen):
         """Cancel the running backup."""
         if self.backup_task:
             self.backup_task.cancel()
-        self.notify("Selective backup cancelled", severity="warning")
+        self.notify(f"{self.backup_name} cancelled", severity="warning")
         self.action_back()
     
     def action_back(self) -> None:
@@ -273,140 +388,136 @@ class SelectiveBackupProgressScreen(Screen):
         self.app.pop_screen()
 
 
-class BackupProgressScreen(Screen):
-    """Screen showing real-time backup progress."""
+class SelectiveBackupProgressScreen(_BaseBackupProgressScreen):
+    """Screen showing real-time selective backup progress."""
     
-    BINDINGS = [
-        Binding("escape", "back", "Back to Dashboard"),
-        Binding("ctrl+c", "cancel_backup", "Cancel Backup"),
-    ]
+    backup_name = "Selective backup"
     
-    def __init__(self, backup_tool: GitHubBackup) -> None:
-        super().__init__()
-        self.backup_tool = backup_tool
-        self.backup_task = None
+    def __init__(self, backup_tool: GitHubBackup, selected_repos: List) -> None:
+        super().__init__(backup_tool)
+        self.selected_repos = selected_repos
+        self.title_text = f"🔄 Selective Backup ({len(selected_repos)} repositories)"
+    
+    def _steps(self) -> List[tuple]:
+        return [
+            (10, f"🚀 Starting selective backup of {len(self.selected_repos)} repositories...",
+             "Initializing selective backup...", None),
+            (20, "📁 Creating backup directory structure...", "Creating backup structure...",
+             self.backup_tool.create_backup_structure),
+            (30, "👤 Backing up user information...", "Backing up user information...",
+             self.backup_tool.backup_user_metadata),
+            (40, f"📦 Backing up {len(self.selected_repos)} selected repositories...",
+             "Backing up selected repositories...", self._backup_selected_repositories),
+            # Skip gists for selective backup to keep it focused
+            (95, "📝 Skipping gists in selective backup...", "Finalizing backup...", None),
+        ]
     
-    def compose(self) -> ComposeResult:
-        yield Header()
-        yield Container(
-            Static("🔄 GitHub Account Backup in Progress", classes="title"),
-            
-            Container(
-                Static("Overall Progress:", classes="section_title"),
-                ProgressBar(total=100, id="overall_progress"),
-                Label("Initializing...", id="overall_status"),
+    async def _backup_selected_repositories(self) -> None:
+        """Backup only the selected repositories, updating widgets as each one completes."""
+        log = self.query_one("#backup_log", RichLog)
+        repo_progress = self.query_one("#repo_progress", ProgressBar)
+        repo_status = self.query_one("#repo_status", Label)
+        
+        # The dashboard hands over the repository objects it listed - nothing to look up
+        selected_repo_objects = self.selected_repos
+        
+        clone_success = 0
+        clone_failures = 0
+        total_repos = len(selected_repo_objects)
+        
+        repo_progress.update(total=total_repos, progress=0)
+        
+        batcher = _LogBatcher(log)
+        pending_progress = None
+        
+        def show_progress() -> None:
+            """Write queued log lines and the latest progress, at most ~20 times per second."""
+            nonlocal pending_progress
+            batcher.flush()
+            if pending_progress:
+                full_name, done = pending_progress
+                repo_status.update(f"Backed up {full_name} ({done}/{total_repos})")
+                repo_progress.update(progress=done)
+                pending_progress = None
+        
+        # A timer shows finished repositories while the next one is still being backed up
+        progress_timer = self.set_interval(batcher.interval, show_progress)
+        
+        # Clones and metadata run in the backup tool's worker pools, sized by parallel_workers;
+        # only waiting for the next finished repository happens in a thread
+        cancel = threading.Event()
+        completed = self.backup_tool.iter_repository_backups(selected_repo_objects, cancel)
+        loop = asyncio.get_running_loop()
+        next_result = None
+        try:
+            for i in range(total_repos):
+                # Shielded, so a cancelled backup can still wait for this next() to return
+                next_result = loop.run_in_executor(None, next, completed, None)
+                result = await asyncio.shield(next_result)
+                if result is None:
+                    break
+                repo, cloned, metadata_saved = result
                 
-                Static("Repository Progress:", classes="section_title"),
-                ProgressBar(total=100, id="repo_progress"),
-                Label("Waiting...", id="repo_status"),
+                if cloned:
+                    batcher.add(f"✓ Cloned {repo.full_name}")
+                    clone_success += 1
+                else:
+                    batcher.add(f"✗ Failed to clone {repo.full_name}")
+                    clone_failures += 1
+                if metadata_saved:
+                    batcher.add(f"Backed up metadata for {repo.full_name}")
+                else:
+                    batcher.add(f"✗ Failed to back up metadata for {repo.full_name}")
                 
-                Static("Current Operation:", classes="section_title"),
-                Label("Starting backup...", id="current_operation"),
+                pending_progress = (repo.full_name, i + 1)
                 
-                classes="progress_container"
-            ),
-            
-            Container(
-                Static("Backup Log:", classes="section_title"),
-                RichLog(id="backup_log", auto_scroll=True),
-                classes="log_container"
-            ),
-            
-            Horizontal(
-                Button("Cancel Backup", variant="error", id="cancel_btn"),
-                Button("Minimize", variant="default", id="minimize_btn"),
-                classes="buttons"
-            ),
-            classes="backup_screen"
-        )
-        yield Footer()
-    
-    def on_mount(self) -> None:
-        """Start the backup process when screen loads."""
-        self.backup_task = asyncio.create_task(self.run_backup())
-    
-    async def run_backup(self) -> None:
-        """Run the backup process with progress updates."""
-        log = self.query_one("#backup_log", RichLog)
-        overall_progress = self.query_one("#overall_progress", ProgressBar)
-        overall_status = self.query_one("#overall_status", Label)
+                # Let the event loop render and handle input before the next repository
+                await asyncio.sleep(0)
+        finally:
+            progress_timer.stop()
+            show_progress()
+            # Drop queued repositories, and only close the generator once it is no longer running
+            cancel.set()
+            if next_result is not None and not next_result.done():
+                await asyncio.wait([next_result])
+            # Shutting down the worker pools blocks, so never do it on the event loop
+            await asyncio.to_thread(completed.close)
         
-        try:
-            log.write("🚀 Starting GitHub account backup...")
-            overall_status.update("Initializing backup...")
-            overall_progress.update(progress=10)
-            
-            # Run the actual backup process
-            await asyncio.get_event_loop().run_in_executor(
-                None, self._run_backup_sync, log, overall_progress, overall_status
-            )
-            
-        except Exception as e:
-            log.write(f"❌ Backup failed: {str(e)}")
-            overall_status.update(f"Backup failed: {str(e)}")
-    
-    def _run_backup_sync(self, log, overall_progress, overall_status):
-        """Run the synchronous backup process."""
-        try:
-            # Create backup structure
-            log.write("📁 Creating backup directory structure...")
-            overall_status.update("Creating backup structure...")
-            overall_progress.update(progress=20)
-            self.backup_tool.create_backup_structure()
-            
-            # Backup user information
-            log.write("👤 Backing up user information...")
-            overall_status.update("Backing up user information...")
-            overall_progress.update(progress=30)
-            self.backup_tool.backup_user_metadata()
-            
-            # Backup all repositories
-            log.write("📦 Backing up repositories...")
-            overall_status.update("Backing up repositories...")
-            overall_progress.update(progress=40)
-            self.backup_tool.backup_repositories()
-            overall_progress.update(progress=85)
-            
-            # Backup gists
-            log.write("📝 Backing up gists...")
-            overall_status.update("Backing up gists...")
-            overall_progress.update(progress=95)
-            self.backup_tool.backup_gists()
-            
-            log.write("✅ Backup completed successfully!")
-            overall_status.update("Backup completed successfully!")
-            overall_progress.update(progress=100)
-            
-            # Change Cancel button to Close button
-            cancel_btn = self.query_one("#cancel_btn", Button)
-            cancel_btn.label = "Close"
-            cancel_btn.variant = "success"
-            
-        except Exception as e:
-            log.write(f"❌ Backup failed: {str(e)}")
-            overall_status.update(f"Backup failed: {str(e)}")
-            raise
+        batcher.add(f"Repository backup completed: {clone_success} successful, {clone_failures} failed")
+        batcher.flush()
+
+
+class BackupProgressScreen(_BaseBackupProgressScreen):
+    """Screen showing real-time backup progress."""
     
-    def on_button_pressed(self, event: Button.Pressed) -> None:
-        if event.button.id == "cancel_btn":
-            # Check if button has been changed to "Close"
-            if event.button.label == "Close":
-                self.action_back()
-            else:
-                self.action_cancel_backup()
-        elif event.button.id == "minimize_btn":
-            self.action_back()
+    title_text = "🔄 GitHub Account Backup in Progress"
+    
+    def _steps(self) -> List[tuple]:
+        return [
+            (10, "🚀 Starting GitHub account backup...", "Initializing backup...", None),
+            (20, "📁 Creating backup directory structure...", "Creating backup structure...",
+             self.backup_tool.create_backup_structure),
+            (30, "👤 Backing up user information...", "Backing up user information...",
+             self.backup_tool.backup_user_metadata),
+            # Repositories advance the progress bars one by one via the callback
+            (40, "📦 Backing up repositories...", "Backing up repositories...",
+             partial(self.backup_tool.backup_repositories, progress_callback=self._repository_backed_up)),
+            (95, "📝 Backing up gists...", "Backing up gists...", self.backup_tool.backup_gists),
+        ]
     
-    def action_cancel_backup(self) -> None:
-        """Cancel the running backup."""
-        if self.backup_task:
-            self.backup_task.cancel()
-        self.notify("Backup cancelled", severity="warning")
-        self.action_back()
+    def _repository_backed_up(self, completed: int, total: int, repo, cloned: bool) -> None:
+        """Report a finished repository from the backup thread."""
+        self.app.call_from_thread(self._show_repository_progress, completed, total, repo, cloned)
     
-    def action_back(self) -> None:
-        """Return to main dashboard."""
-        self.app.pop_screen()
+    def _show_repository_progress(self, completed: int, total: int, repo, cloned: bool) -> None:
+        """Advance the repository and overall progress bars for a finished repository."""
+        self.query_one("#repo_progress", ProgressBar).update(total=total, progress=completed)
+        self.query_one("#repo_status", Label).update(f"Backed up {repo.full_name} ({completed}/{total})")
+        # Repositories fill the overall bar from 40% to 85%
+        self.query_one("#overall_progress", ProgressBar).update(progress=40 + 45 * completed / total)
+        
+        if not cloned:
+            self.query_one("#backup_log", RichLog).write(f"✗ Failed to clone {repo.full_name}")
 
 
 class SettingsScreen(Screen):
@@ -442,6 +553,14 @@ class SettingsScreen(Screen):
                         Label("Parallel Workers:"),
                         Select([("1", 1), ("2", 2), ("4", 4), ("8", 8)], id="workers_select"),
                         
+                        Label("Extract Repositories With:"),
+                        RadioSet(
+                            RadioButton("Full history", id="extract_full"),
+                            RadioButton("Latest commit only", id="extract_latest"),
+                            RadioButton("All commits, current files only", id="extract_checkout-only"),
+                            id="extract_depth_set"
+                        ),
+                        
                         Label("Auto-backup Schedule:"),
                         Select([
                             ("Disabled", "disabled"),
@@ -453,52 +572,9 @@ class SettingsScreen(Screen):
                         classes="settings_form"
                     )
                 
-                with TabPane("Advanced", id="advanced_tab"):
-                    yield Container(
-                        Label("GitHub API Settings:"),
-                        
-                        Horizontal(
-                            Label("API Rate Limit Buffer:"),
-                            Input(value="100", id="rate_limit_input"),
-                        ),
-                        
-                        Horizontal(
-                            Label("Request Timeout (seconds):"),
-                            Input(value="30", id="timeout_input"),
-                        ),
-                        
-                        Label("Backup Options:"),
-                        
-                        Horizontal(
-                            Switch(id="backup_issues_switch"),
-                            Label("Backup Issues & PRs"),
-                        ),
-                        
-                        Horizontal(
-                            Switch(id="backup_wikis_switch"),
-                            Label("Backup Wiki Pages"),
-                        ),
-                        
-                        Horizontal(
-                            Switch(id="backup_releases_switch"),
-                            Label("Backup Releases & Assets"),
-                        ),
-                        
-                        classes="settings_form"
-                    )
-                
-                with TabPane("Storage", id="storage_tab"):
-                    yield Container(
-                        DataTable(id="settings_table"),
-                        
-                        Horizontal(
-                            Button("Add Setting", variant="primary", id="add_setting_btn"),
-                            Button("Delete Selected", variant="error", id="delete_setting_btn"),
-                            Button("Export Config", variant="default", id="export_btn"),
-                        ),
-                        
-                        classes="storage_tab"
-                    )
+                # Filled in on first activation, see on_tabbed_content_tab_activated
+                yield TabPane("Advanced", id="advanced_tab")
+                yield TabPane("Storage", id="storage_tab")
             
             yield Horizontal(
                 Button("Save Changes", variant="primary", id="save_btn"),
@@ -508,13 +584,17 @@ class SettingsScreen(Screen):
             )
         yield Footer()
     
+    def __init__(self) -> None:
+        super().__init__()
+        self._mounted_tabs = set()
+    
     def on_mount(self) -> None:
         """Load current settings when screen mounts."""
         self.load_settings()
     
     def load_settings(self) -> None:
         """Load settings from database into form."""
-        settings = SettingsManager()
+        settings = self.app.settings
         
         # Load into form fields
         backup_dir = self.query_one("#backup_dir_input", Input)
@@ -523,13 +603,80 @@ class SettingsScreen(Screen):
         workers_select = self.query_one("#workers_select", Select)
         workers_select.value = settings.get_parallel_workers()
         
-        # Load settings table
+        self.query_one(f"#extract_{settings.get_extract_depth()}", RadioButton).value = True
+    
+    async def on_tabbed_content_tab_activated(self, event: TabbedContent.TabActivated) -> None:
+        """Build the Advanced and Storage tabs the first time they are shown."""
+        pane_id = event.pane.id
+        if pane_id in self._mounted_tabs:
+            return
+            
+        if pane_id == "advanced_tab":
+            self._mounted_tabs.add(pane_id)
+            await event.pane.mount(self._compose_advanced_tab())
+        elif pane_id == "storage_tab":
+            self._mounted_tabs.add(pane_id)
+            await event.pane.mount(self._compose_storage_tab())
+            self._load_settings_table()
+    
+    def _compose_advanced_tab(self) -> Container:
+        """Create the Advanced tab contents."""
+        return Container(
+            Label("GitHub API Settings:"),
+            
+            Horizontal(
+                Label("API Rate Limit Buffer:"),
+                Input(value=str(self.app.settings.get_throttle_limit()), id="rate_limit_input"),
+            ),
+            
+            Horizontal(
+                Label("Request Timeout (seconds):"),
+                Input(value="30", id="timeout_input"),
+            ),
+            
+            Label("Backup Options:"),
+            
+            Horizontal(
+                Switch(id="backup_issues_switch"),
+                Label("Backup Issues & PRs"),
+            ),
+            
+            Horizontal(
+                Switch(id="backup_wikis_switch"),
+                Label("Backup Wiki Pages"),
+            ),
+            
+            Horizontal(
+                Switch(id="backup_releases_switch"),
+                Label("Backup Releases & Assets"),
+            ),
+            
+            classes="settings_form"
+        )
+    
+    def _compose_storage_tab(self) -> Container:
+        """Create the Storage tab contents."""
+        return Container(
+            DataTable(id="settings_table"),
+            
+            Horizontal(
+                Button("Add Setting", variant="primary", id="add_setting_btn"),
+                Button("Delete Selected", variant="error", id="delete_setting_btn"),
+                Button("Export Config", variant="default", id="export_btn"),
+            ),
+            
+            classes="storage_tab"
+        )
+    
+    def _load_settings_table(self) -> None:
+        """Load all settings into the Storage tab table."""
         table = self.query_one("#settings_table", DataTable)
         table.add_columns("Key", "Encrypted", "Description", "Updated")
         
-        for key, info in settings.list_settings().items():
-            encrypted = "✓" if info['encrypted'] else ""
-            table.add_row(key, encrypted, info['description'] or "", info['updated_at'])
+        table.add_rows(
+            (key, "✓" if info['encrypted'] else "", info['description'] or "", info['updated_at'])
+            for key, info in self.app.settings.list_settings().items()
+        )
     
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "save_btn":
@@ -543,14 +690,14 @@ class SettingsScreen(Screen):
         """Update GitHub token."""
         token_input = self.query_one("#token_input", Input)
         if token_input.value:
-            settings = SettingsManager()
+            settings = self.app.settings
             settings.set_github_token(token_input.value)
             self.notify("GitHub token updated!", severity="information")
             token_input.value = ""
     
     def action_save(self) -> None:
         """Save all settings."""
-        settings = SettingsManager()
+        settings = self.app.settings
         
         # Save form values
         backup_dir = self.query_one("#backup_dir_input", Input)
@@ -559,6 +706,19 @@ class SettingsScreen(Screen):
         workers_select = self.query_one("#workers_select", Select)
         settings.set_parallel_workers(workers_select.value)
         
+        extract_depth = self.query_one("#extract_depth_set", RadioSet).pressed_button
+        if extract_depth is not None:
+            settings.set_extract_depth(extract_depth.id.removeprefix("extract_"))
+        
+        # The Advanced tab only exists once it has been opened
+        if "advanced_tab" in self._mounted_tabs:
+            rate_limit_input = self.query_one("#rate_limit_input", Input)
+            try:
+                settings.set_throttle_limit(int(rate_limit_input.value))
+            except ValueError:
+                self.notify("API Rate Limit Buffer must be a whole number", severity="error")
+                return
+        
         self.notify("Settings saved!", severity="information")
     
     def action_back(self) -> None:
@@ -580,6 +740,26 @@ class MainDashboard(Screen):
         Binding("q", "quit", "Quit"),
     ]
     
+    def __init__(self) -> None:
+        super().__init__()
+        # GitHub user and first page of repositories, shared by both loaders and
+        # revalidated with conditional requests on refresh
+        self._user = None
+        self._user_stale = False
+        self._repos_cache: Optional[List] = None
+        self._repos_etag: Optional[str] = None
+        self._repos_stale = False
+        self._cache_lock = threading.Lock()
+        self.selected_repos = set()
+        # Repository name of each table row, kept in step with the table by _fill_repos_table
+        self._row_repo_names: List[str] = []
+        # Deletions waiting for Ctrl+Y confirmation
+        self.awaiting_delete_confirmation = False
+        self.pending_delete_repo: Optional[str] = None
+        self.awaiting_delete_all_confirmation = False
+        self.pending_delete_all_repos: Optional[List] = None
+        self._account_info_text: Optional[str] = None
+    
     def compose(self) -> ComposeResult:
         yield Header()
         yield Container(
@@ -632,76 +812,141 @@ class MainDashboard(Screen):
         self.load_account_info()
         self.load_repositories()
     
+    def _get_user(self):
+        """Get the authenticated GitHub user, revalidating it after a refresh."""
+        user = self.app.github_user()
+        
+        with self._cache_lock:
+            if user is None:
+                return None
+                
+            if user is not self._user:
+                # A new token means a new account - the cached repositories belong to the old one
+                self._user = user
+                self._repos_cache = None
+                self._repos_etag = None
+            elif self._user_stale:
+                # 304 Not Modified keeps the cached profile and doesn't count against the rate limit
+                self._user.update()
+                
+            self._user_stale = False
+            return self._user
+    
+    def _get_repos(self) -> Optional[List]:
+        """Get the first 20 repositories, revalidating them after a refresh."""
+        user = self._get_user()
+        if user is None:
+            return None
+            
+        with self._cache_lock:
+            if self._repos_cache is None or self._repos_stale:
+                self._repos_cache = self._fetch_first_repos()
+                self._repos_stale = False
+            return self._repos_cache
+    
+    def _fetch_first_repos(self) -> List:
+        """Request the first 20 repositories, reusing the cached list on 304 Not Modified."""
+        headers = {}
+        if self._repos_cache is not None and self._repos_etag:
+            headers['If-None-Match'] = self._repos_etag
+            
+        # Only the first page is requested for the first 20 repos (limit for demo)
+        status, response_headers, output = self.app.github.requester.requestJson(
+            "GET", "/user/repos", parameters={'type': 'all', 'per_page': 20}, headers=headers
+        )
+        if status == 304:
+            return self._repos_cache
+            
+        data = orjson.loads(output) if output else None
+        if status >= 400:
+            raise GithubException(status, data, response_headers)
+            
+        self._repos_etag = response_headers.get('etag')
+        return [self.app.github.create_from_raw_data(Repository, raw, response_headers) for raw in data]
+    
+    def _mark_cache_stale(self) -> None:
+        """Have the next load revalidate the cached user and repositories with GitHub."""
+        with self._cache_lock:
+            self._user_stale = True
+            self._repos_stale = True
+    
+    @work(exclusive=True, thread=True, group="account_info")
     def load_account_info(self) -> None:
-        """Load GitHub account information."""
+        """Load GitHub account information in a worker thread."""
         try:
-            settings = SettingsManager()
-            token = settings.get_github_token()
+            user = self._get_user()
             
-            if not token:
-                self.query_one("#account_info").update("⚠️  No GitHub token configured")
+            if user is None:
+                self.app.call_from_thread(self._show_account_info, "⚠️  No GitHub token configured")
                 return
-                
-            github = Github(token)
-            user = github.get_user()
             
-            # Get actual repo counts by fetching repositories
-            repos = list(user.get_repos(type='all'))
-            private_count = sum(1 for repo in repos if repo.private)
-            public_count = sum(1 for repo in repos if not repo.private)
+            # Repo counts are part of the /user response - no need to list every repository
+            public_count = user.public_repos
+            private_count = user.owned_private_repos or 0
             
-            info_text = f"""
-👤 **{user.login}** ({user.name or 'No name'})
-📧 {user.email or 'Email private'}
-📁 {public_count} public repos
-🔐 {private_count} private repos
-👥 {user.followers} followers, {user.following} following
-📅 Joined {user.created_at.strftime('%Y-%m-%d') if user.created_at else 'Unknown'}
-            """
+            info_text = ACCOUNT_INFO_TEMPLATE.format_map({
+                'login': user.login,
+                'name': user.name or 'No name',
+                'email': user.email or 'Email private',
+                'public': public_count,
+                'private': private_count,
+                'followers': user.followers,
+                'following': user.following,
+                'joined': user.created_at.strftime('%Y-%m-%d') if user.created_at else 'Unknown',
+            })
             
-            self.query_one("#account_info").update(info_text.strip())
+            self.app.call_from_thread(self._show_account_info, info_text)
             
         except Exception as e:
-            self.query_one("#account_info").update(f"❌ Error loading account: {str(e)}")
+            self.app.call_from_thread(self._show_account_info, f"❌ Error loading account: {str(e)}")
+    
+    def _show_account_info(self, text: str) -> None:
+        """Show account information; called on the UI thread."""
+        # Unchanged text on refresh would only cause a needless re-layout of the panel
+        if text == self._account_info_text:
+            return
+        self._account_info_text = text
+        self.query_one("#account_info", Static).update(text)
     
+    @work(exclusive=True, thread=True, group="repositories")
     def load_repositories(self) -> None:
-        """Load repositories into the table."""
+        """Load repositories into the table in a worker thread."""
         try:
-            settings = SettingsManager()
-            token = settings.get_github_token()
+            repos = self._get_repos()
             
-            if not token:
+            if repos is None:
                 return
-                
-            github = Github(token)
-            user = github.get_user()
-            
-            table = self.query_one("#repos_table", DataTable)
-            
-            # Clear existing data
-            table.clear()
-            
-            # Add columns only if they don't exist
-            if not table.columns:
-                table.add_columns("✓", "Name", "Type", "Language", "Updated")
-            
-            # Initialize selected repos set if it doesn't exist
-            if not hasattr(self, 'selected_repos'):
-                self.selected_repos = set()
-            
-            repos = list(user.get_repos(type='all'))[:20]  # Limit for demo
             
+            rows = []
             for repo in repos:
-                # Show selection status
-                selected = "✓" if repo.name in self.selected_repos else " "
                 repo_type = "Private" if repo.private else "Public"
                 language = repo.language or "N/A"
                 updated = repo.updated_at.strftime('%Y-%m-%d') if repo.updated_at else "N/A"
                 
-                table.add_row(selected, repo.name, repo_type, language, updated)
+                rows.append((repo.name, repo_type, language, updated))
+                
+            self.app.call_from_thread(self._fill_repos_table, rows)
                 
         except Exception as e:
-            self.notify(f"Error loading repositories: {str(e)}", severity="error")
+            self.app.call_from_thread(self.notify, f"Error loading repositories: {str(e)}", severity="error")
+    
+    def _fill_repos_table(self, rows: List[tuple]) -> None:
+        """Replace the repository table contents in a single update; called on the UI thread."""
+        table = self.query_one("#repos_table", DataTable)
+        
+        # Clear existing data
+        table.clear()
+        
+        # Add columns only if they don't exist
+        if not table.columns:
+            table.add_columns("✓", "Name", "Type", "Language", "Updated")
+            
+        self._row_repo_names = [row[0] for row in rows]
+        
+        # Selection marks are added here, where selected_repos is only touched by the UI thread
+        table.add_rows(
+            ("✓" if row[0] in self.selected_repos else " ", *row) for row in rows
+        )
     
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "backup_btn":
@@ -724,7 +969,7 @@ class MainDashboard(Screen):
     def action_start_backup(self) -> None:
         """Start full backup process."""
         try:
-            settings = SettingsManager()
+            settings = self.app.settings
             backup_tool = GitHubBackup(settings_manager=settings)
             self.app.install_screen(BackupProgressScreen(backup_tool), name="backup_progress")
             self.app.push_screen("backup_progress")
@@ -737,6 +982,7 @@ class MainDashboard(Screen):
     
     def action_refresh(self) -> None:
         """Refresh dashboard data."""
+        self._mark_cache_stale()
         self.load_account_info()
         self.load_repositories()
         self.notify("Dashboard refreshed", severity="information")
@@ -744,7 +990,7 @@ class MainDashboard(Screen):
     def action_view_last_backup(self) -> None:
         """View the last backup details."""
         try:
-            settings = SettingsManager()
+            settings = self.app.settings
             backup_dir = Path(settings.get_backup_directory())
             
             if not backup_dir.exists():
@@ -752,20 +998,16 @@ class MainDashboard(Screen):
                 return
                 
             # Find the most recent backup directory
-            backup_dirs = [d for d in backup_dir.iterdir() if d.is_dir() and d.name.startswith("github_backup_")]
+            backup_dirs = _list_backups(backup_dir)
             
             if not backup_dirs:
                 self.notify("No backups found", severity="information")
                 return
                 
-            latest_backup = max(backup_dirs, key=lambda d: d.stat().st_mtime)
+            latest_backup = backup_dirs[0]
             
             # Show backup info screen
-            if self.app.is_screen_installed("backup_view"):
-                self.app.uninstall_screen("backup_view")
-            
-            self.app.install_screen(BackupViewScreen(latest_backup), name="backup_view")
-            self.app.push_screen("backup_view")
+            self.app.show_backup_view(latest_backup)
             
         except Exception as e:
             self.notify(f"Error viewing backup: {str(e)}", severity="error")
@@ -773,23 +1015,20 @@ class MainDashboard(Screen):
     def action_view_backup_history(self) -> None:
         """View all backup history and allow selection."""
         try:
-            settings = SettingsManager()
+            settings = self.app.settings
             backup_dir = Path(settings.get_backup_directory())
             
             if not backup_dir.exists():
                 self.notify("No backup directory found", severity="warning")
                 return
                 
-            # Find all backup directories
-            backup_dirs = [d for d in backup_dir.iterdir() if d.is_dir() and d.name.startswith("github_backup_")]
+            # Find all backup directories, most recent first
+            backup_dirs = _list_backups(backup_dir)
             
             if not backup_dirs:
                 self.notify("No backups found", severity="information")
                 return
                 
-            # Sort by creation time (most recent first)
-            backup_dirs.sort(key=lambda d: d.stat().st_mtime, reverse=True)
-            
             # Show backup history screen - uninstall if it exists first
             if self.app.is_screen_installed("backup_history"):
                 self.app.uninstall_screen("backup_history")
@@ -808,7 +1047,7 @@ class MainDashboard(Screen):
                 self.notify("No repository selected", severity="warning")
                 return
             
-            repo_name = table.get_row_at(table.cursor_row)[1]  # Name is now in column 1
+            repo_name = self._row_repo_names[table.cursor_row]
             
             # Simple confirmation via notification for now
             self.pending_delete_repo = repo_name
@@ -818,19 +1057,17 @@ class MainDashboard(Screen):
         except Exception as e:
             self.notify(f"Error selecting repository: {str(e)}", severity="error")
     
-    def action_delete_all_repos(self) -> None:
+    async def action_delete_all_repos(self) -> None:
         """Delete ALL repositories from GitHub with confirmation."""
         try:
-            settings = SettingsManager()
-            token = settings.get_github_token()
-            if not token:
+            # The dashboard's client and user are reused for as long as the token is unchanged
+            user = await asyncio.to_thread(self._get_user)
+            if user is None:
                 self.notify("No GitHub token configured", severity="error")
                 return
             
-            from github import Github
-            github = Github(token)
-            user = github.get_user()
-            repos = list(user.get_repos(type='all'))
+            # Paging through the repositories blocks, so keep it off the event loop
+            repos = await asyncio.to_thread(list, user.get_repos(type='all'))
             
             if not repos:
                 self.notify("No repositories found to delete", severity="information")
@@ -839,6 +1076,8 @@ class MainDashboard(Screen):
             # Show serious warning
             self.notify(f"🚨 WARNING: This will DELETE ALL {len(repos)} repositories from GitHub!", severity="error")
             self.notify(f"⚠️  Press Ctrl+Y to confirm DELETION OF ALL REPOS or any other key to cancel", severity="error")
+            # Kept for the confirmed delete, so the repositories aren't listed a second time
+            self.pending_delete_all_repos = repos
             self.awaiting_delete_all_confirmation = True
             
         except Exception as e:
@@ -846,25 +1085,26 @@ class MainDashboard(Screen):
     
     def on_key(self, event) -> None:
         """Handle key presses for confirmations."""
-        if hasattr(self, 'awaiting_delete_confirmation') and self.awaiting_delete_confirmation:
+        if self.awaiting_delete_confirmation:
             self.awaiting_delete_confirmation = False
             
-            if event.key == "ctrl+y" and hasattr(self, 'pending_delete_repo'):
+            if event.key == "ctrl+y" and self.pending_delete_repo:
                 self._execute_single_repo_delete(self.pending_delete_repo)
             else:
                 self.notify("Repository deletion cancelled", severity="information")
             
-            if hasattr(self, 'pending_delete_repo'):
-                delattr(self, 'pending_delete_repo')
+            self.pending_delete_repo = None
             return
         
-        if hasattr(self, 'awaiting_delete_all_confirmation') and self.awaiting_delete_all_confirmation:
+        if self.awaiting_delete_all_confirmation:
             self.awaiting_delete_all_confirmation = False
             
             if event.key == "ctrl+y":
-                self._execute_delete_all_repos()
+                self._execute_delete_all_repos(self.pending_delete_all_repos)
             else:
                 self.notify("Delete all repositories cancelled", severity="information")
+            
+            self.pending_delete_all_repos = None
             return
         
         # Handle normal key bindings - let the app handle them
@@ -872,14 +1112,10 @@ class MainDashboard(Screen):
     def _execute_single_repo_delete(self, repo_name: str) -> None:
         """Execute the actual deletion of a single repository."""
         try:
-            settings = SettingsManager()
-            token = settings.get_github_token()
-            
-            from github import Github
-            github = Github(token)
-            user = github.get_user()
-            
-            repo = user.get_repo(repo_name)
+            # The table rows come from the listed repositories, so the DELETE needs no lookup GET first
+            repo = next((r for r in self._repos_cache or [] if r.name == repo_name), None)
+            if repo is None:
+                repo = self._get_user().get_repo(repo_name)
             
             # Check if repo exists and get info before deletion
             repo_full_name = repo.full_name
@@ -892,19 +1128,11 @@ class MainDashboard(Screen):
             result = repo.delete()
             self.notify(f"✅ API call completed. Result: {result}", severity="information")
             
-            # Add a small delay and double-check deletion
-            import time
-            time.sleep(1)
-            
-            try:
-                # Try to access the repo again - should fail if truly deleted
-                check_repo = user.get_repo(repo_name)
-                self.notify(f"⚠️  Repository '{repo_full_name}' still exists after deletion attempt", severity="warning")
-            except:
-                # This is expected - repo should not be found after deletion
-                self.notify(f"🗑️  Successfully deleted repository '{repo_full_name}'", severity="information")
+            # DELETE only returns without raising on 204 No Content, so there's nothing left to verify
+            self.notify(f"🗑️  Successfully deleted repository '{repo_full_name}'", severity="information")
             
             # Refresh the repository list
+            self._mark_cache_stale()
             self.load_repositories()
             
         except Exception as e:
@@ -918,40 +1146,60 @@ class MainDashboard(Screen):
             else:
                 self.notify(f"Error deleting repository '{repo_name}': {str(e)}", severity="error")
     
-    def _execute_delete_all_repos(self) -> None:
-        """Execute the actual deletion of all repositories."""
+    def _show_status(self, text: str) -> None:
+        """Show text in the dashboard status bar; called on the UI thread."""
+        self.query_one("#status_label", Label).update(text)
+    
+    @work(exclusive=True, thread=True, group="delete_all")
+    def _execute_delete_all_repos(self, repos: List) -> None:
+        """Execute the actual deletion of the listed repositories in a worker thread."""
         try:
-            settings = SettingsManager()
-            token = settings.get_github_token()
-            
-            from github import Github
-            github = Github(token)
-            user = github.get_user()
-            
-            repos = list(user.get_repos(type='all'))
             deleted_count = 0
-            failed_count = 0
-            
-            for repo in repos:
+            failed = []
+            rate_limited = []
+            
+            # Deletes are sent one at a time: GitHub asks for mutating requests to be serialized,
+            # and the client only spaces writes apart when they come from a single thread
+            for done, repo in enumerate(repos, 1):
+                self.app.call_from_thread(
+                    self._show_status, f"🗑️  Deleting repositories... {done}/{len(repos)}: {repo.name}"
+                )
                 try:
                     repo.delete()
                     deleted_count += 1
-                    self.notify(f"🗑️  Deleted {repo.name} ({deleted_count}/{len(repos)})", severity="information")
+                except RateLimitExceededException:
+                    # The client already waited and retried; the rest would only be refused too
+                    rate_limited = [r.name for r in repos[done - 1:]]
+                    break
                 except Exception as e:
-                    failed_count += 1
-                    self.notify(f"❌ Failed to delete {repo.name}: {str(e)}", severity="error")
+                    failed.append(f"{repo.name} ({str(e)})")
             
-            if deleted_count > 0:
-                self.notify(f"✅ Deleted {deleted_count} repositories", severity="information")
+            self.app.call_from_thread(self._show_status, "Ready")
             
-            if failed_count > 0:
-                self.notify(f"⚠️  {failed_count} repositories failed to delete", severity="warning")
+            if deleted_count > 0:
+                self.app.call_from_thread(
+                    self.notify, f"✅ Deleted {deleted_count} repositories", severity="information"
+                )
+            
+            if failed:
+                self.app.call_from_thread(
+                    self.notify, f"⚠️  {len(failed)} repositories failed to delete: {', '.join(failed)}", severity="warning"
+                )
+            
+            if rate_limited:
+                self.app.call_from_thread(
+                    self.notify,
+                    f"⏳ GitHub rate limit reached, {len(rate_limited)} repositories were not deleted - "
+                    f"try again later: {_name_summary(rate_limited)}",
+                    severity="warning"
+                )
             
             # Refresh the repository list
-            self.load_repositories()
+            self._mark_cache_stale()
+            self.app.call_from_thread(self.load_repositories)
             
         except Exception as e:
-            self.notify(f"Error during bulk delete: {str(e)}", severity="error")
+            self.app.call_from_thread(self.notify, f"Error during bulk delete: {str(e)}", severity="error")
     
     def action_toggle_repo_selection(self) -> None:
         """Toggle selection of the currently highlighted repository."""
@@ -961,12 +1209,8 @@ class MainDashboard(Screen):
                 self.notify("No repository selected", severity="warning")
                 return
             
-            # Initialize selected repos set if it doesn't exist
-            if not hasattr(self, 'selected_repos'):
-                self.selected_repos = set()
-            
-            # Get repo name from the currently highlighted row (Name is in column 1)
-            repo_name = table.get_row_at(table.cursor_row)[1]
+            # Get repo name of the currently highlighted row
+            repo_name = self._row_repo_names[table.cursor_row]
             
             # Toggle selection
             if repo_name in self.selected_repos:
@@ -976,8 +1220,10 @@ class MainDashboard(Screen):
                 self.selected_repos.add(repo_name)
                 action = "selected"
             
-            # Refresh the table to update visual indicators
-            self.load_repositories()
+            # Only the selection mark of this row changes - no need to reload the table
+            table.update_cell_at(
+                Coordinate(table.cursor_row, 0), "✓" if repo_name in self.selected_repos else " "
+            )
             
             self.notify(f"📋 {action.title()} '{repo_name}' ({len(self.selected_repos)} total selected)", severity="information")
             
@@ -992,15 +1238,8 @@ class MainDashboard(Screen):
                 self.notify("No repositories to select", severity="information")
                 return
             
-            # Initialize selected repos set if it doesn't exist
-            if not hasattr(self, 'selected_repos'):
-                self.selected_repos = set()
-            
             # Check if all repos are already selected
-            all_repo_names = set()
-            for row_index in range(table.row_count):
-                repo_name = table.get_row_at(row_index)[1]  # Name is in column 1
-                all_repo_names.add(repo_name)
+            all_repo_names = set(self._row_repo_names)
             
             if all_repo_names.issubset(self.selected_repos):
                 # All are selected, so deselect all
@@ -1011,8 +1250,10 @@ class MainDashboard(Screen):
                 self.selected_repos.update(all_repo_names)
                 action = "Selected all"
             
-            # Refresh the table to update visual indicators
-            self.load_repositories()
+            # Only the selection marks change - no need to reload the table
+            mark = "✓" if action == "Selected all" else " "
+            for row_index in range(table.row_count):
+                table.update_cell_at(Coordinate(row_index, 0), mark)
             
             self.notify(f"📋 {action} repositories ({len(self.selected_repos)} total selected)", severity="information")
             
@@ -1022,18 +1263,23 @@ class MainDashboard(Screen):
     def action_backup_selected_repos(self) -> None:
         """Backup only the selected repositories."""
         try:
-            if not hasattr(self, 'selected_repos') or not self.selected_repos:
+            if not self.selected_repos:
                 self.notify("No repositories selected. Use spacebar to select individual repos or Ctrl+A to select all.", severity="warning")
                 return
             
-            selected_count = len(self.selected_repos)
+            # Resolve the selected names against the listed repositories instead of listing the account again
+            repos_by_name = {repo.name: repo for repo in self._repos_cache or []}
+            selected_repos = [repos_by_name[name] for name in self.selected_repos if name in repos_by_name]
+            if not selected_repos:
+                self.notify("Selected repositories are no longer listed. Refresh and select again.", severity="warning")
+                return
             
             # Create a custom backup tool for selected repositories
-            settings = SettingsManager()
+            settings = self.app.settings
             backup_tool = GitHubBackup(settings_manager=settings)
             
             # Create a custom backup screen for selected repos
-            self.app.install_screen(SelectiveBackupProgressScreen(backup_tool, self.selected_repos), name="selective_backup_progress")
+            self.app.install_screen(SelectiveBackupProgressScreen(backup_tool, selected_repos), name="selective_backup_progress")
             self.app.push_screen("selective_backup_progress")
             
         except Exception as e:
@@ -1052,6 +1298,10 @@ class BackupHistoryScreen(Screen):
     def __init__(self, backup_dirs: List[Path]) -> None:
         super().__init__()
         self.backup_dirs = backup_dirs
+        # Backup deletion waiting for Ctrl+Y confirmation
+        self.awaiting_delete_backup_confirmation = False
+        self.pending_delete_backup: Optional[Path] = None
+        self.pending_delete_index: Optional[int] = None
     
     def compose(self) -> ComposeResult:
         yield Header()
@@ -1084,30 +1334,28 @@ class BackupHistoryScreen(Screen):
         try:
             table = self.query_one("#backups_table", DataTable)
             table.clear()
-            table.add_columns("Date & Time", "Size", "Repositories", "Type", "Age")
+            if not table.columns:
+                table.add_columns("Date & Time", "Size", "Repositories", "Type", "Age")
             
+            # Rows are added in one batch once every backup has been read
+            rows = []
             for backup_dir in self.backup_dirs:
                 try:
                     # Parse backup name to get date/time
                     backup_name = backup_dir.name
                     # Extract timestamp from name like: github_backup_Viroscope_20250731_140538
-                    parts = backup_name.split('_')
-                    if len(parts) >= 4:
-                        date_str = parts[-2]  # 20250731
-                        time_str = parts[-1]  # 140538
+                    stamp = backup_name[-15:]  # 20250731_140538
+                    if stamp[8:9] == '_' and backup_name[-16:-15] == '_':
                         # Format: YYYY-MM-DD HH:MM:SS
-                        formatted_date = f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]} {time_str[:2]}:{time_str[2:4]}:{time_str[4:6]}"
+                        formatted_date = f"{stamp[:4]}-{stamp[4:6]}-{stamp[6:8]} {stamp[9:11]}:{stamp[11:13]}:{stamp[13:15]}"
                     else:
                         formatted_date = "Unknown"
                     
-                    # Get backup size
-                    total_size = sum(f.stat().st_size for f in backup_dir.rglob('*') if f.is_file())
-                    size_mb = total_size / (1024 * 1024)
+                    # Size and repository count are stored with the backup, computed once for older ones
+                    stats = read_backup_stats(backup_dir)
+                    size_mb = stats['size_bytes'] / (1024 * 1024)
                     size_text = f"{size_mb:.1f} MB"
-                    
-                    # Count repositories
-                    repos_dir = backup_dir / 'repositories'
-                    repo_count = len(list(repos_dir.iterdir())) if repos_dir.exists() else 0
+                    repo_count = stats['repo_count']
                     
                     # Determine backup type
                     backup_type = "Full"  # Could be enhanced to detect selective backups
@@ -1121,12 +1369,14 @@ class BackupHistoryScreen(Screen):
                     else:  # Days
                         age = f"{int(age_seconds // 86400)} days ago"
                     
-                    table.add_row(formatted_date, size_text, str(repo_count), backup_type, age)
+                    rows.append((formatted_date, size_text, str(repo_count), backup_type, age))
                     
                 except Exception as e:
                     # Add row with error info if we can't parse this backup
-                    table.add_row(backup_dir.name, "Error", "?", "Unknown", f"Error: {str(e)[:20]}")
+                    rows.append((backup_dir.name, "Error", "?", "Unknown", f"Error: {str(e)[:20]}"))
                     
+            table.add_rows(rows)
+            
         except Exception as e:
             self.notify(f"Error loading backup history: {str(e)}", severity="error")
     
@@ -1159,11 +1409,7 @@ class BackupHistoryScreen(Screen):
             selected_backup = self.backup_dirs[table.cursor_row]
             
             # Open the backup view screen with the selected backup
-            if self.app.is_screen_installed("backup_view"):
-                self.app.uninstall_screen("backup_view")
-            
-            self.app.install_screen(BackupViewScreen(selected_backup), name="backup_view")
-            self.app.push_screen("backup_view")
+            self.app.show_backup_view(selected_backup)
             
         except Exception as e:
             self.notify(f"Error viewing selected backup: {str(e)}", severity="error")
@@ -1192,13 +1438,11 @@ class BackupHistoryScreen(Screen):
         """Refresh the backup history."""
         # Reload backup directories
         try:
-            settings = SettingsManager()
+            settings = self.app.settings
             backup_dir = Path(settings.get_backup_directory())
             
             if backup_dir.exists():
-                backup_dirs = [d for d in backup_dir.iterdir() if d.is_dir() and d.name.startswith("github_backup_")]
-                backup_dirs.sort(key=lambda d: d.stat().st_mtime, reverse=True)
-                self.backup_dirs = backup_dirs
+                self.backup_dirs = _list_backups(backup_dir)
                 
             self.load_backup_history()
             self.notify("Backup history refreshed", severity="information")
@@ -1208,33 +1452,29 @@ class BackupHistoryScreen(Screen):
     
     def on_key(self, event) -> None:
         """Handle key presses for backup deletion confirmation."""
-        if hasattr(self, 'awaiting_delete_backup_confirmation') and self.awaiting_delete_backup_confirmation:
+        if self.awaiting_delete_backup_confirmation:
             self.awaiting_delete_backup_confirmation = False
             
-            if event.key == "ctrl+y" and hasattr(self, 'pending_delete_backup'):
-                self._execute_backup_deletion()
+            if event.key == "ctrl+y" and self.pending_delete_backup:
+                self._execute_backup_deletion(self.pending_delete_backup)
             else:
                 self.notify("Backup deletion cancelled", severity="information")
             
             # Clean up
-            if hasattr(self, 'pending_delete_backup'):
-                delattr(self, 'pending_delete_backup')
-            if hasattr(self, 'pending_delete_index'):
-                delattr(self, 'pending_delete_index')
+            self.pending_delete_backup = None
+            self.pending_delete_index = None
             return
     
-    def _execute_backup_deletion(self) -> None:
+    @work(exclusive=True, group="delete_backup")
+    async def _execute_backup_deletion(self, backup_to_delete: Path) -> None:
         """Execute the actual backup deletion."""
         try:
-            import shutil
-            
-            backup_to_delete = self.pending_delete_backup
             backup_name = backup_to_delete.name
             
             self.notify(f"🔄 Deleting backup '{backup_name}'...", severity="information")
             
-            # Delete the entire backup directory
-            shutil.rmtree(backup_to_delete)
+            # Delete the entire backup directory in a thread - large backups take seconds
+            await asyncio.to_thread(shutil.rmtree, backup_to_delete)
             
             # Remove from our list
             self.backup_dirs.remove(backup_to_delete)
@@ -1262,9 +1502,28 @@ class BackupViewScreen(Screen):
         Binding("ctrl+a", "extract_all", "Extract All Repos"),
     ]
     
+    # Repository action run by each context menu key
+    _ACTION_KEYS = {
+        'e': 'action_extract_single_repo',
+        'r': 'action_restore_single_repo',
+        'd': 'action_delete_single_repo',
+        'i': 'show_repo_details',
+    }
+    
+    # Restore privacy per key: private, public, or None to keep the original setting
+    _RESTORE_KEYS = {'o': None, 'p': False, 'r': True}
+    
     def __init__(self, backup_path: Path) -> None:
         super().__init__()
         self.backup_path = backup_path
+        # Parsed metadata.json of each backed-up repository, filled while loading the contents
+        self._repo_meta: Dict[str, Dict] = {}
+        # Highlighted repository and the keypress each prompt is waiting for
+        self.selected_repo: Optional[str] = None
+        self.awaiting_action = False
+        self.awaiting_restore_choice = False
+        # Repository, user and original settings of the restore awaiting a privacy choice
+        self._restore_ctx: Optional[Dict] = None
     
     def compose(self) -> ComposeResult:
         yield Header()
@@ -1298,6 +1557,7 @@ class BackupViewScreen(Screen):
         """Load backup information when screen mounts."""
         self.load_backup_info()
         self.load_backup_contents()
+        self.run_worker(partial(_sweep_trash, self.backup_path.parent), thread=True, group="sweep_trash")
     
     def load_backup_info(self) -> None:
         """Load and display backup information."""
@@ -1305,13 +1565,10 @@ class BackupViewScreen(Screen):
             # Get backup creation time
             created = datetime.fromtimestamp(self.backup_path.stat().st_mtime)
             
-            # Get backup size
-            total_size = sum(f.stat().st_size for f in self.backup_path.rglob('*') if f.is_file())
-            size_mb = total_size / (1024 * 1024)
-            
-            # Count repositories
-            repos_dir = self.backup_path / 'repositories'
-            repo_count = len(list(repos_dir.iterdir())) if repos_dir.exists() else 0
+            # Size and repository count are stored with the backup, computed once for older ones
+            stats = read_backup_stats(self.backup_path)
+            size_mb = stats['size_bytes'] / (1024 * 1024)
+            repo_count = stats['repo_count']
             
             info_text = f"""
 📅 Created: {created.strftime('%Y-%m-%d %H:%M:%S')}
@@ -1325,38 +1582,69 @@ class BackupViewScreen(Screen):
         except Exception as e:
             self.query_one("#backup_info").update(f"❌ Error loading backup info: {str(e)}")
     
-    def load_backup_contents(self) -> None:
-        """Load backup contents into the table."""
+    def _backup_changed(self) -> None:
+        """Refresh the stored stats and overview after the backup was changed, from a worker thread."""
+        refresh_backup_stats(self.backup_path)
+        if self.is_attached:
+            self.app.call_from_thread(self.load_backup_info)
+    
+    @work(exclusive=True, group="backup_contents")
+    async def load_backup_contents(self) -> None:
+        """Load backup contents into the table, adding each repository as it is read."""
         try:
             table = self.query_one("#repos_table", DataTable)
-            table.add_columns("Repository", "Type", "Size", "Status")
+            table.clear()
+            if not table.columns:
+                table.add_columns("Repository", "Type", "Size", "Status")
             
             repos_dir = self.backup_path / 'repositories'
             if not repos_dir.exists():
                 return
                 
-            for repo_dir in repos_dir.iterdir():
-                if repo_dir.is_dir():
-                    # Check if git repo was cloned (bare repository)
-                    git_dir = repo_dir / 'git'
-                    has_git = git_dir.exists() and (git_dir / 'HEAD').exists() and (git_dir / 'objects').exists()
-                    
-                    # Calculate size
-                    size = sum(f.stat().st_size for f in repo_dir.rglob('*') if f.is_file())
-                    size_mb = size / (1024 * 1024)
-                    
-                    # Check for metadata
-                    metadata_file = repo_dir / 'metadata.json'
-                    has_metadata = metadata_file.exists()
-                    
-                    status = "✅ Complete" if (has_git and has_metadata) else "⚠️ Partial"
-                    repo_type = "Bare Git + Metadata" if (has_git and has_metadata) else "Metadata Only" if has_metadata else "Unknown"
-                    
-                    table.add_row(repo_dir.name, repo_type, f"{size_mb:.1f} MB", status)
-                    
+            repo_dirs = await asyncio.to_thread(lambda: [d for d in repos_dir.iterdir() if d.is_dir()])
+            self._repo_meta = {}
+            
+            # Repositories are walked concurrently in threads, so slow filesystems overlap
+            for row in asyncio.as_completed([asyncio.to_thread(self._backup_contents_row, d) for d in repo_dirs]):
+                table.add_row(*await row)
+            
+            # Rows arrive in completion order; settle on a stable order by repository name
+            table.sort(next(iter(table.columns)))
+            
         except Exception as e:
             self.notify(f"Error loading backup contents: {str(e)}", severity="error")
     
+    def _backup_contents_row(self, repo_dir: Path) -> tuple:
+        """Build the contents table row for one backed-up repository; runs in a thread."""
+        # One listing per directory answers every existence check below
+        with os.scandir(repo_dir) as entries:
+            names = {entry.name for entry in entries}
+        
+        # Check if git repo was cloned (bare repository)
+        has_git = False
+        if 'git' in names:
+            with os.scandir(repo_dir / 'git') as entries:
+                has_git = {'HEAD', 'objects'} <= {entry.name for entry in entries}
+        
+        # Calculate size
+        size = dir_size(repo_dir)
+        size_mb = size / (1024 * 1024)
+        
+        # Check for metadata, keeping it for the details and restore actions
+        has_metadata = 'metadata.json' in names
+        if has_metadata:
+            try:
+                with open(repo_dir / 'metadata.json', 'rb') as f:
+                    self._repo_meta[repo_dir.name] = orjson.loads(f.read())
+            except (OSError, orjson.JSONDecodeError):
+                # Unreadable metadata only marks this repository partial
+                has_metadata = False
+        
+        status = "✅ Complete" if (has_git and has_metadata) else "⚠️ Partial"
+        repo_type = "Bare Git + Metadata" if (has_git and has_metadata) else "Metadata Only" if has_metadata else "Unknown"
+        
+        return (repo_dir.name, repo_type, f"{size_mb:.1f} MB", status)
+    
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "back_btn":
             self.action_back()
@@ -1387,90 +1675,133 @@ class BackupViewScreen(Screen):
             repo_name = table.get_row_at(event.coordinate.row)[0]
             self.show_repo_context_menu(repo_name)
     
-    def action_open_folder(self) -> None:
+    @work(exclusive=True, group="open_folder")
+    async def action_open_folder(self) -> None:
         """Open backup folder in system file manager."""
-        import subprocess
-        import platform
-        
         try:
             system = platform.system()
             if system == "Darwin":  # macOS
-                subprocess.run(["open", str(self.backup_path)])
+                opener = "open"
             elif system == "Windows":
-                subprocess.run(["explorer", str(self.backup_path)])
+                opener = "explorer"
             else:  # Linux
-                subprocess.run(["xdg-open", str(self.backup_path)])
+                opener = "xdg-open"
+            
+            # Awaiting the launcher keeps the UI responsive while the file manager starts
+            proc = await asyncio.create_subprocess_exec(opener, str(self.backup_path))
+            await proc.wait()
             
             self.notify("Opened backup folder", severity="information")
         except Exception as e:
             self.notify(f"Error opening folder: {str(e)}", severity="error")
     
+    @work(thread=True, group="repo_actions")
     def action_extract_single_repo(self, repo_name: str) -> None:
-        """Extract a single repository to working directory."""
+        """Extract a single repository to working directory in a worker thread."""
         try:
-            import subprocess
-            
-            # Create extracted repos directory
-            extract_dir = self.backup_path / 'extracted_repos'
-            extract_dir.mkdir(exist_ok=True)
-            
-            repo_backup_dir = self.backup_path / 'repositories' / repo_name
-            git_dir = repo_backup_dir / 'git'
-            
+            git_dir = self.backup_path / 'repositories' / repo_name / 'git'
             if not git_dir.exists():
-                self.notify(f"No git backup found for {repo_name}", severity="error")
+                self.app.call_from_thread(self.notify, f"No git backup found for {repo_name}", severity="error")
                 return
             
-            # Extract to working directory
+            extract_dir = self.backup_path / 'extracted_repos'
+            extract_dir.mkdir(exist_ok=True)
             extract_repo_dir = extract_dir / repo_name
             
-            # Remove existing extraction
-            if extract_repo_dir.exists():
-                import shutil
-                shutil.rmtree(extract_repo_dir)
+            ok, error = self._extract_one(git_dir, extract_repo_dir, self._extract_clone_args())
+            if ok:
+                self._backup_changed()
+                self.app.call_from_thread(
+                    self.notify, f"✅ Extracted {repo_name} to {extract_repo_dir}", severity="information"
+                )
+            else:
+                self.app.call_from_thread(self.notify, f"Failed to extract {repo_name}: {error}", severity="error")
+        except Exception as e:
+            self.app.call_from_thread(self.notify, f"Error extracting {repo_name}: {str(e)}", severity="error")
+    
+    def _extract_clone_args(self) -> List[str]:
+        """Return the git clone arguments for the extraction depth chosen in settings."""
+        return EXTRACT_DEPTH_ARGS[self.app.settings.get_extract_depth()]
+    
+    def _extract_one(self, git_dir: Path, dest: Path, clone_args: List[str]) -> Tuple[bool, str]:
+        """Clone a backed-up bare repository into dest, returning (ok, error message).
+        
+        Paths are resolved by the caller; safe to run from worker threads as it never touches the UI.
+        """
+        try:
+            # Move any existing extraction aside; its files are deleted in the background
+            try:
+                _discard_tree(dest, self.backup_path.parent)
+            except FileNotFoundError:
+                pass
             
             # Clone from bare repo to working directory
             subprocess.run([
-                'git', 'clone', str(git_dir), str(extract_repo_dir)
-            ], check=True, capture_output=True)
-            
-            self.notify(f"✅ Extracted {repo_name} to {extract_repo_dir}", severity="information")
-            
+                'git', 'clone', '-q', *clone_args, str(git_dir), str(dest)
+            ], check=True, **_QUIET)
+            return True, ""
         except subprocess.CalledProcessError as e:
-            self.notify(f"Failed to extract {repo_name}: {e.stderr.decode()}", severity="error")
-        except Exception as e:
-            self.notify(f"Error extracting {repo_name}: {str(e)}", severity="error")
+            return False, e.stderr.decode()
+        except OSError as e:
+            return False, str(e)
     
+    @work(exclusive=True, thread=True, group="extract_all")
     def action_extract_all_repos(self) -> None:
-        """Extract all repositories to working directories."""
+        """Extract all repositories to working directories in a worker thread."""
         try:
             repos_dir = self.backup_path / 'repositories'
             if not repos_dir.exists():
-                self.notify("No repositories found in backup", severity="warning")
+                self.app.call_from_thread(self.notify, "No repositories found in backup", severity="warning")
                 return
             
-            extracted_count = 0
-            failed_count = 0
-            
-            for repo_dir in repos_dir.iterdir():
-                if repo_dir.is_dir():
-                    git_dir = repo_dir / 'git'
-                    if git_dir.exists() and (git_dir / 'HEAD').exists():
-                        try:
-                            self.action_extract_single_repo(repo_dir.name)
-                            extracted_count += 1
-                        except:
-                            failed_count += 1
-            
-            if extracted_count > 0:
-                extract_dir = self.backup_path / 'extracted_repos'
-                self.notify(f"✅ Extracted {extracted_count} repos to {extract_dir}", severity="information")
-            
-            if failed_count > 0:
-                self.notify(f"⚠️  {failed_count} repos failed to extract", severity="warning")
+            # d_type answers is_dir without a stat; one stat of HEAD confirms the git backup
+            git_dirs = {}
+            with os.scandir(repos_dir) as it:
+                for entry in it:
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
+                    git_dir = os.path.join(entry.path, 'git')
+                    try:
+                        os.stat(os.path.join(git_dir, 'HEAD'))
+                    except FileNotFoundError:
+                        continue
+                    git_dirs[entry.name] = Path(git_dir)
+            
+            extract_dir = self.backup_path / 'extracted_repos'
+            extract_dir.mkdir(exist_ok=True)
+            clone_args = self._extract_clone_args()
+            
+            extracted = []
+            failed = []
+            
+            # Clones mostly wait on disk and git subprocesses, so a few run side by side
+            with ThreadPoolExecutor(max_workers=EXTRACT_WORKERS, thread_name_prefix='extract') as pool:
+                futures = {
+                    pool.submit(self._extract_one, git_dir, extract_dir / name, clone_args): name
+                    for name, git_dir in git_dirs.items()
+                }
+                for future in as_completed(futures):
+                    ok, _ = future.result()
+                    (extracted if ok else failed).append(futures[future])
+            
+            # One summary per outcome instead of a toast per repository
+            if extracted:
+                self._backup_changed()
+                self.app.call_from_thread(
+                    self.notify,
+                    f"✅ Extracted {len(extracted)} repos to {extract_dir}: {_name_summary(extracted)}",
+                    severity="information"
+                )
+            
+            if failed:
+                self.app.call_from_thread(
+                    self.notify,
+                    f"⚠️  {len(failed)} repos failed to extract: {_name_summary(failed)}",
+                    severity="warning"
+                )
                 
         except Exception as e:
-            self.notify(f"Error extracting repos: {str(e)}", severity="error")
+            self.app.call_from_thread(self.notify, f"Error extracting repos: {str(e)}", severity="error")
     
     def action_delete_backup(self) -> None:
         """Delete the backup after confirmation."""
@@ -1479,14 +1810,14 @@ class BackupViewScreen(Screen):
     
     def action_extract_selected(self) -> None:
         """Extract the currently selected repository."""
-        if hasattr(self, 'selected_repo') and self.selected_repo:
+        if self.selected_repo:
             self.action_extract_single_repo(self.selected_repo)
         else:
             self.notify("No repository selected", severity="warning")
     
     def action_delete_selected(self) -> None:
         """Delete the currently selected repository."""
-        if hasattr(self, 'selected_repo') and self.selected_repo:
+        if self.selected_repo:
             self.action_delete_single_repo(self.selected_repo)
         else:
             self.notify("No repository selected", severity="warning")
@@ -1495,29 +1826,27 @@ class BackupViewScreen(Screen):
         """Extract all repositories (same as extract_all_repos)."""
         self.action_extract_all_repos()
     
+    @work(thread=True, group="repo_actions")
     def action_delete_single_repo(self, repo_name: str) -> None:
-        """Delete a single repository from the backup."""
+        """Delete a single repository from the backup in a worker thread."""
         try:
-            import shutil
-            
             repo_backup_dir = self.backup_path / 'repositories' / repo_name
             if repo_backup_dir.exists():
-                shutil.rmtree(repo_backup_dir)
-                self.notify(f"🗑️  Deleted {repo_name} from backup", severity="information")
+                _discard_tree(repo_backup_dir, self.backup_path.parent)
+                self._repo_meta.pop(repo_name, None)
+                self._backup_changed()
+                self.app.call_from_thread(self.notify, f"🗑️  Deleted {repo_name} from backup", severity="information")
                 
                 # Refresh the table to show the change
-                self.load_backup_contents()
+                self.app.call_from_thread(self.load_backup_contents)
             else:
-                self.notify(f"Repository {repo_name} not found", severity="error")
+                self.app.call_from_thread(self.notify, f"Repository {repo_name} not found", severity="error")
                 
         except Exception as e:
-            self.notify(f"Error deleting {repo_name}: {str(e)}", severity="error")
+            self.app.call_from_thread(self.notify, f"Error deleting {repo_name}: {str(e)}", severity="error")
     
     def show_repo_context_menu(self, repo_name: str) -> None:
         """Show context menu for repository actions."""
-        from textual.widgets import OptionList
-        from textual.containers import Center
-        
         # Create a simple action selection using notifications for now
         # In a full implementation, this would be a proper modal dialog
         actions = [
@@ -1539,108 +1868,96 @@ class BackupViewScreen(Screen):
     
     def on_key(self, event) -> None:
         """Handle key presses for context menu actions."""
-        if hasattr(self, 'awaiting_restore_choice') and self.awaiting_restore_choice:
+        key = event.key.lower()
+        
+        if self.awaiting_restore_choice:
             self.awaiting_restore_choice = False
             
-            if event.key.lower() == 'o':  # Original privacy setting
-                self._execute_restore_with_privacy(self.restore_original_private)
-            elif event.key.lower() == 'p':  # Public
-                self._execute_restore_with_privacy(False)
-            elif event.key.lower() == 'r':  # Private
-                self._execute_restore_with_privacy(True)
-            elif event.key == 'escape':
+            if key in self._RESTORE_KEYS:
+                make_private = self._RESTORE_KEYS[key]
+                if make_private is None:
+                    make_private = self._restore_ctx['original_private']
+                self._execute_restore_with_privacy(make_private)
+            elif key == 'escape':
                 self.notify("Repository restore cancelled", severity="information")
             else:
                 self.notify("Invalid choice. Repository restore cancelled.", severity="warning")
             
-            # Clean up restore state variables
-            for attr in ['restore_repo_name', 'restore_original_private', 'restore_original_description', 
-                        'restore_github', 'restore_user', 'restore_repo_backup_dir']:
-                if hasattr(self, attr):
-                    delattr(self, attr)
+            # Clean up restore state
+            self._restore_ctx = None
             
             event.prevent_default()
             return
         
-        if hasattr(self, 'awaiting_action') and self.awaiting_action:
+        if self.awaiting_action:
             self.awaiting_action = False
             
-            if event.key.lower() == 'e' and hasattr(self, 'selected_repo'):
-                self.action_extract_single_repo(self.selected_repo)
-            elif event.key.lower() == 'r' and hasattr(self, 'selected_repo'):
-                self.action_restore_single_repo(self.selected_repo)
-            elif event.key.lower() == 'd' and hasattr(self, 'selected_repo'):
-                self.action_delete_single_repo(self.selected_repo)
-            elif event.key.lower() == 'i' and hasattr(self, 'selected_repo'):
-                self.show_repo_details(self.selected_repo)
+            action = self._ACTION_KEYS.get(key)
+            if action and self.selected_repo:
+                getattr(self, action)(self.selected_repo)
             
             event.prevent_default()
             return
             
         # Handle normal key bindings if not in context menu mode - let the app handle them
     
+    @work(thread=True, group="repo_actions")
     def show_repo_details(self, repo_name: str) -> None:
-        """Show detailed information about a repository."""
+        """Show detailed information about a repository from a worker thread."""
         try:
             repo_dir = self.backup_path / 'repositories' / repo_name
             git_dir = repo_dir / 'git'
             metadata_file = repo_dir / 'metadata.json'
+            metadata = self._repo_metadata(repo_name)
             
             details = f"📊 Repository: {repo_name}\n"
             
             if git_dir.exists():
                 # Get repository size
-                size = sum(f.stat().st_size for f in repo_dir.rglob('*') if f.is_file())
+                size = dir_size(repo_dir)
                 details += f"💾 Size: {size / (1024 * 1024):.1f} MB\n"
                 
                 # Get commit count (if possible)
                 try:
-                    import subprocess
-                    result = subprocess.run(
-                        ['git', '--git-dir', str(git_dir), 'rev-list', '--count', 'HEAD'],
-                        capture_output=True, text=True, check=True
-                    )
-                    commit_count = result.stdout.strip()
+                    counted_sha = metadata and metadata.get('commit_count_sha')
+                    commit_count = _commit_count(git_dir, metadata_file, metadata)
                     details += f"📝 Commits: {commit_count}\n"
+                    if metadata and metadata.get('commit_count_sha') != counted_sha:
+                        # The count was written back into metadata.json
+                        self._backup_changed()
                 except:
                     details += "📝 Commits: Unable to count\n"
             
-            if metadata_file.exists():
+            if metadata is not None:
                 details += "📋 Metadata: Available\n"
             
             details += f"📁 Location: {repo_dir}"
             
-            self.notify(details, severity="information")
+            self.app.call_from_thread(self.notify, details, severity="information")
             
         except Exception as e:
-            self.notify(f"Error getting details for {repo_name}: {str(e)}", severity="error")
+            self.app.call_from_thread(self.notify, f"Error getting details for {repo_name}: {str(e)}", severity="error")
+    
+    def _repo_metadata(self, repo_name: str) -> Optional[Dict]:
+        """Return a repository's parsed metadata.json, or None if it has none."""
+        metadata = self._repo_meta.get(repo_name)
+        if metadata is None:
+            # Not loaded yet - the contents table may still be filling in
+            metadata_file = self.backup_path / 'repositories' / repo_name / 'metadata.json'
+            if metadata_file.exists():
+                with open(metadata_file, 'rb') as f:
+                    metadata = self._repo_meta[repo_name] = orjson.loads(f.read())
+        return metadata
     
     def action_restore_single_repo(self, repo_name: str) -> None:
         """Restore a repository from backup to GitHub."""
         try:
-            from settings import SettingsManager
-            from github import Github
-            import subprocess
-            import tempfile
-            
-            # Get GitHub token
-            settings = SettingsManager()
-            token = settings.get_github_token()
-            if not token:
+            # The app-wide user is reused for as long as the token is unchanged
+            user = self.app.github_user()
+            if user is None:
                 self.notify("No GitHub token configured", severity="error")
                 return
             
-            github = Github(token)
-            user = github.get_user()
-            
-            # Check if repo already exists on GitHub
-            try:
-                existing_repo = user.get_repo(repo_name)
-                self.notify(f"⚠️  Repository {repo_name} already exists on GitHub", severity="warning")
-                return
-            except:
-                pass  # Repo doesn't exist, which is what we want
-            
             # Read original repository metadata to get privacy and other settings
             repo_backup_dir = self.backup_path / 'repositories' / repo_name
             metadata_file = repo_backup_dir / 'metadata.json'
@@ -1650,11 +1967,9 @@ class BackupViewScreen(Screen):
             
             if metadata_file.exists():
                 try:
-                    import json
-                    with open(metadata_file, 'r') as f:
-                        metadata = json.load(f)
-                        original_private = metadata.get('private', False)
-                        original_description = metadata.get('description', '')
+                    metadata = self._repo_metadata(repo_name)
+                    original_private = metadata.get('private', False)
+                    original_description = metadata.get('description', '')
                         
                     privacy_text = "private" if original_private else "public"
                     self.notify(f"📋 Original repository was {privacy_text}", severity="information")
@@ -1662,12 +1977,13 @@ class BackupViewScreen(Screen):
                     self.notify(f"⚠️  Could not read original metadata: {e}", severity="warning")
             
             # Prompt user for privacy choice
-            self.restore_repo_name = repo_name
-            self.restore_original_private = original_private
-            self.restore_original_description = original_description
-            self.restore_github = github
-            self.restore_user = user
-            self.restore_repo_backup_dir = repo_backup_dir
+            self._restore_ctx = {
+                'repo_name': repo_name,
+                'original_private': original_private,
+                'original_description': original_description,
+                'user': user,
+                'repo_backup_dir': repo_backup_dir,
+            }
             
             privacy_choice = "private" if original_private else "public"
             self.notify(f"🔧 Restore Options for '{repo_name}' (originally {privacy_choice}):", severity="information")
@@ -1682,69 +1998,70 @@ class BackupViewScreen(Screen):
     
     def _execute_restore_with_privacy(self, make_private: bool) -> None:
         """Execute the actual repository restore with specified privacy setting."""
+        # The restore state is cleared as soon as the choice is handled, so hand it over now
+        ctx = self._restore_ctx
+        self._restore_repository(
+            ctx['repo_name'], ctx['user'], ctx['original_description'], ctx['repo_backup_dir'], make_private
+        )
+    
+    @work(thread=True, group="repo_actions")
+    def _restore_repository(self, repo_name: str, user, original_description: Optional[str],
+                            repo_backup_dir: Path, make_private: bool) -> None:
+        """Create the repository on GitHub and push the backup to it in a worker thread."""
         try:
-            import subprocess
-            import tempfile
-            
-            repo_name = self.restore_repo_name
-            user = self.restore_user
-            original_description = self.restore_original_description
-            
             # Create new repository on GitHub with chosen privacy setting
             privacy_text = "private" if make_private else "public"
-            self.notify(f"🔄 Creating {privacy_text} repository {repo_name} on GitHub...", severity="information")
-            
-            new_repo = user.create_repo(
-                name=repo_name,
-                private=make_private,
-                description=original_description or f"Restored from GitKeeper backup"
+            self.app.call_from_thread(
+                self.notify, f"🔄 Creating {privacy_text} repository {repo_name} on GitHub...", severity="information"
             )
             
+            # Creating is the existence check: GitHub answers 422 when the name is taken
+            try:
+                user.create_repo(
+                    name=repo_name,
+                    private=make_private,
+                    description=original_description or f"Restored from GitKeeper backup"
+                )
+            except GithubException as e:
+                if e.status == 422:
+                    self.app.call_from_thread(
+                        self.notify, f"⚠️  Repository {repo_name} already exists on GitHub", severity="warning"
+                    )
+                    return
+                raise
+            
             # Push from backup to new repo
-            git_backup_dir = self.restore_repo_backup_dir / 'git'
+            git_backup_dir = repo_backup_dir / 'git'
             if not git_backup_dir.exists():
-                self.notify(f"No git backup found for {repo_name}", severity="error")
+                self.app.call_from_thread(self.notify, f"No git backup found for {repo_name}", severity="error")
                 return
             
-            # Use temporary directory to push
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_repo_dir = Path(temp_dir) / repo_name
-                
-                # Clone from backup
-                subprocess.run([
-                    'git', 'clone', str(git_backup_dir), str(temp_repo_dir)
-                ], check=True, capture_output=True)
-                
-                # Remove existing origin and set new GitHub remote
-                subprocess.run([
-                    'git', '-C', str(temp_repo_dir), 'remote', 'remove', 'origin'
-                ], check=True, capture_output=True)
-                
-                # Get GitHub token for authenticated URL
-                settings = SettingsManager()
-                token = settings.get_github_token()
-                
-                # Add GitHub remote with authentication
-                auth_url = f"https://{token}@github.com/{user.login}/{repo_name}.git"
-                subprocess.run([
-                    'git', '-C', str(temp_repo_dir), 'remote', 'add', 'origin', auth_url
-                ], check=True, capture_output=True)
-                
-                # Push all branches and tags
-                subprocess.run([
-                    'git', '-C', str(temp_repo_dir), 'push', '--all', 'origin'
-                ], check=True, capture_output=True)
-                
-                subprocess.run([
-                    'git', '-C', str(temp_repo_dir), 'push', '--tags', 'origin'
-                ], check=True, capture_output=True)
+            # The token reaches git through the credential helper, never the command line
+            env = {
+                **os.environ,
+                'GITKEEPER_TOKEN': self.app.settings.get_github_token(),
+                'GIT_TERMINAL_PROMPT': '0',
+            }
             
-            self.notify(f"✅ Successfully restored {repo_name} as {privacy_text} repository!", severity="information")
+            # Push all branches and tags straight from the bare backup in one git process - no
+            # working clone needed. Not --mirror: mirror backups carry refs/pull/*, which GitHub
+            # rejects, failing the whole push.
+            subprocess.run([
+                'git', *_TOKEN_CREDENTIALS, '--git-dir', str(git_backup_dir), 'push', '-q',
+                f"https://github.com/{user.login}/{repo_name}.git",
+                'refs/heads/*:refs/heads/*', 'refs/tags/*:refs/tags/*'
+            ], check=True, env=env, **_QUIET)
+            
+            self.app.call_from_thread(
+                self.notify, f"✅ Successfully restored {repo_name} as {privacy_text} repository!", severity="information"
+            )
             
         except subprocess.CalledProcessError as e:
-            self.notify(f"Git error restoring {repo_name}: {e.stderr.decode()}", severity="error")
+            self.app.call_from_thread(
+                self.notify, f"Git error restoring {repo_name}: {e.stderr.decode()}", severity="error"
+            )
         except Exception as e:
-            self.notify(f"Error restoring {repo_name}: {str(e)}", severity="error")
+            self.app.call_from_thread(self.notify, f"Error restoring {repo_name}: {str(e)}", severity="error")
     
     def action_back(self) -> None:
         """Return to main dashboard."""
@@ -1881,17 +2198,60 @@ class GitKeeperApp(App):
         "settings": SettingsScreen,
     }
     
+    def __init__(self) -> None:
+        super().__init__()
+        # One settings manager (and database connection) shared by every screen
+        self.settings = SettingsManager()
+        # One GitHub client and user per token, shared by every screen
+        self.github: Optional[Github] = None
+        self._github_token: Optional[str] = None
+        self._github_user = None
+        self._github_lock = threading.Lock()
+    
     def on_mount(self) -> None:
         """Check if setup is needed on app start."""
-        settings = SettingsManager()
-        token = settings.get_github_token()
+        token = self.settings.get_github_token()
         
         if not token:
             self.push_screen("setup")
         else:
             self.push_screen("main")
+    
+    def github_user(self):
+        """Get the authenticated GitHub user, creating the client once per token."""
+        token = self.settings.get_github_token()
+        if not token:
+            return None
+            
+        with self._github_lock:
+            if self.github is None or token != self._github_token:
+                # Full pages keep the delete-all listing to as few requests as possible
+                self.github = Github(token, per_page=100)
+                self._github_token = token
+                self._github_user = self.github.get_user()
+            return self._github_user
+    
+    def show_backup_view(self, backup_path: Path) -> None:
+        """Show the backup view screen for backup_path, reusing it if it already shows that backup."""
+        if self.is_screen_installed("backup_view"):
+            # Rebuilding the screen would re-read the whole backup for nothing
+            if self.get_screen("backup_view").backup_path == backup_path:
+                self.push_screen("backup_view")
+                return
+            self.uninstall_screen("backup_view")
+        
+        self.install_screen(BackupViewScreen(backup_path), name="backup_view")
+        self.push_screen("backup_view")
 
 
 if __name__ == "__main__":
     app = GitKeeperApp()
-    app.run()
\ No newline at end of file
+    try:
+        import uvloop
+    except ImportError:
+        # uvloop is optional and not available on Windows
+        app.run()
+    else:
+        loop = uvloop.new_event_loop()
+        asyncio.set_event_loop(loop)
+        app.run(loop=loop)
\ No newline at end of file